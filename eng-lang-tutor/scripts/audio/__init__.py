@@ -1,23 +1,29 @@
 #!/usr/bin/env python3
 """Audio functionality: TTS, composition, conversion, Feishu integration."""
 
-from .composer import AudioComposer, CompositionResult
-from .converter import AudioConverter, ConversionResult, convert_mp3_to_opus
-from .utils import get_ffmpeg_path, get_audio_duration
-from .feishu_voice import FeishuVoiceSender, VoiceSendResult
-from .tts import TTSManager, TTSProvider, TTSResult
+import importlib
 
-__all__ = [
-    'AudioComposer',
-    'CompositionResult',
-    'AudioConverter',
-    'ConversionResult',
-    'convert_mp3_to_opus',
-    'get_ffmpeg_path',
-    'get_audio_duration',
-    'FeishuVoiceSender',
-    'VoiceSendResult',
-    'TTSManager',
-    'TTSProvider',
-    'TTSResult',
-]
+# 导出名 -> 子模块，访问时才导入：只用到转换或合成时不必加载 aiohttp、TTS 依赖
+_EXPORTS = {
+    'AudioComposer': '.composer',
+    'CompositionResult': '.composer',
+    'AudioConverter': '.converter',
+    'ConversionResult': '.converter',
+    'convert_mp3_to_opus': '.converter',
+    'get_ffmpeg_path': '.utils',
+    'get_audio_duration': '.utils',
+    'FeishuVoiceSender': '.feishu_voice',
+    'VoiceSendResult': '.feishu_voice',
+    'TTSManager': '.tts',
+    'TTSProvider': '.tts',
+    'TTSResult': '.tts',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,7 +5,7 @@
 音频结构：
 - expressions: 引导语 [1s] 内容 [2s]
 - alternatives: 引导语 [1s] 内容 [2s]
-- dialogues: 引导语 [1s] 对话行1 [0.5s] 对话行2 ...
+- dialogues: 引导语 [1s] 对话行1 [0.5s] 对话行2 ...（同一角色的连续台词合并为一段）
 
 使用示例：
     from scripts.audio_composer import AudioComposer
@@ -17,15 +17,27 @@
     result = composer.compose_keypoint_audio(keypoint, Path("output.mp3"))
 """
 
+import hashlib
+import os
+import random
 import subprocess
 import tempfile
 import shutil
+import threading
+import time
+import wave
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from itertools import groupby
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple, ClassVar, Union
+from xml.sax.saxutils import escape as xml_escape
 from dataclasses import dataclass
 
 from .tts import TTSManager
-from .utils import get_ffmpeg_path, get_audio_duration
+from .utils import (
+    FFMPEG_QUIET_ARGS, decode_stderr, get_ffmpeg_path, get_audio_duration, get_wav_duration
+)
 
 
 @dataclass
@@ -44,10 +56,31 @@ class AudioComposer:
     将 expressions + alternatives + dialogues 合并为单个音频文件
     """
 
+    # TTS 片段磁盘缓存（按 provider + 音色 + 语速 + 文本寻址）
+    DEFAULT_CACHE_DIR = Path.home() / ".cache" / "eng-lang-tutor" / "tts"
+    DEFAULT_CACHE_TTL = 30 * 24 * 3600  # 缓存有效期（秒），None 表示永不过期
+    DEFAULT_MAX_CACHE_SIZE = 2000       # 最多保留的片段数，超出后按最近访问时间淘汰
+    CACHE_PRUNE_INTERVAL = 50           # 每写入多少个新片段检查一次缓存上限（期间最多超出这么多条）
+    DEFAULT_MAX_WORKERS = 8             # 并发 TTS 请求数
+    DEFAULT_BATCH_WORKERS = 2           # compose_batch 同时进行的合成数
+    OUTPUT_BITRATE = "48k"              # 成品 MP3 比特率（与 Edge-TTS 输出一致）
+
+    # 成品时长由各片段时长累加得到；按此比例抽样实际探测并与累加值比对（0 表示不校验）
+    DURATION_CHECK_RATE: ClassVar[float] = 0.0
+    DURATION_CHECK_TOLERANCE: ClassVar[float] = 0.2  # 允许的误差（秒），MP3 帧填充会带来少量偏差
+
+    # 空白片段缓存，所有实例共享：(时长, 采样率) -> 文件路径
+    _SILENCE_CACHE: ClassVar[Dict[Tuple[float, int], Path]] = {}
+    _SILENCE_LOCK: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         tts_manager: TTSManager,
-        ffmpeg_path: Optional[str] = None
+        ffmpeg_path: Optional[str] = None,
+        cache_dir: Optional[Path] = None,
+        cache_ttl: Optional[float] = DEFAULT_CACHE_TTL,
+        max_cache_size: int = DEFAULT_MAX_CACHE_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS
     ):
         """
         初始化音频合成器
@@ -55,12 +88,41 @@ class AudioComposer:
         Args:
             tts_manager: TTS 管理器实例
             ffmpeg_path: ffmpeg 可执行文件路径（默认自动检测）
+            cache_dir: TTS 片段缓存目录（默认 ~/.cache/eng-lang-tutor/tts）
+            cache_ttl: 缓存有效期（秒），None 表示永不过期
+            max_cache_size: 最多缓存的片段数，0 表示禁用缓存
+            max_workers: 并发 TTS 请求数（不超过 provider 的 BATCH_CONCURRENCY）
         """
         self.tts = tts_manager
         self.ffmpeg_path = ffmpeg_path or get_ffmpeg_path()
 
-        # 创建临时目录用于存放中间文件
+        provider_limit = getattr(getattr(tts_manager, "provider", None), "BATCH_CONCURRENCY", None)
+        if provider_limit:
+            max_workers = min(max_workers, provider_limit)
+        self.max_workers = max(1, max_workers)
+
+        # 片段合成线程池，实例内所有合成（包括 compose_batch 并行的合成）共享，
+        # 同时进行的 TTS 请求总数不超过 max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="audio_composer"
+        )
+
+        # 实例级临时根目录；每次合成在其下创建独立子目录，合成结束即删除，
+        # 因此同一实例可被多个线程同时调用
         self.temp_dir = Path(tempfile.mkdtemp(prefix="audio_composer_"))
+        # 实例被回收或解释器退出时自动关闭线程池并删除临时目录，不依赖 __del__
+        self._finalizer = weakref.finalize(
+            self, self._release, self._executor, str(self.temp_dir)
+        )
+
+        # 重复出现的引导语/表达无需再次调用 TTS
+        self.cache_ttl = cache_ttl
+        self.max_cache_size = max_cache_size
+        self._segment_cache_dir = Path(cache_dir) if cache_dir else self.DEFAULT_CACHE_DIR
+        if self.max_cache_size > 0:
+            self._segment_cache_dir.mkdir(parents=True, exist_ok=True)
+        self._cache_prune_lock = threading.Lock()
+        self._cache_stores = 0
 
     def __enter__(self):
         """上下文管理器入口"""
@@ -72,13 +134,22 @@ class AudioComposer:
         return False
 
     def _cleanup(self):
-        """清理临时目录"""
-        if hasattr(self, 'temp_dir') and self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
+        """关闭线程池并清理临时目录（只执行一次）"""
+        finalizer = getattr(self, "_finalizer", None)
+        if finalizer is not None:
+            finalizer()
 
-    def __del__(self):
-        """析构函数（备用清理，不保证被调用）"""
-        self._cleanup()
+    @staticmethod
+    def _release(executor: ThreadPoolExecutor, temp_dir: str) -> None:
+        """
+        释放实例持有的资源（由 weakref.finalize 调用，不能引用实例本身）
+
+        Args:
+            executor: 片段合成线程池
+            temp_dir: 临时根目录
+        """
+        executor.shutdown(wait=True)
+        shutil.rmtree(temp_dir, ignore_errors=True)
 
     def compose_keypoint_audio(
         self,
@@ -90,7 +161,9 @@ class AudioComposer:
         narrator_voice: str = None,     # 旁白音色（None 时使用 TTS provider 默认值）
         voice_a: str = None,            # 对话 A 音色（None 时使用 TTS provider 默认值）
         voice_b: str = None,            # 对话 B 音色（None 时使用 TTS provider 默认值）
-        speed: float = 0.9              # 语速
+        speed: float = 0.9,             # 语速
+        merge_speaker_runs: bool = True,   # 合并同一角色的连续台词
+        speaker_run_separator: str = ". "  # 合并台词时的分隔符（不支持 SSML 时使用）
     ) -> CompositionResult:
         """
         合成知识点音频
@@ -105,145 +178,56 @@ class AudioComposer:
             voice_a: 对话 A 角色音色
             voice_b: 对话 B 角色音色
             speed: 语速
+            merge_speaker_runs: 是否将同一角色的连续台词合并为一次 TTS 请求
+            speaker_run_separator: 合并台词时的分隔符；支持 SSML 时改用 <break> 留白
 
         Returns:
             CompositionResult: 合成结果
         """
+        call_dir = None
         try:
             # 使用 TTS provider 的默认音色（自动适配 Edge-TTS 或讯飞）
             narrator_voice = narrator_voice or self.tts.get_voice_by_role("narrator")
             voice_a = voice_a or self.tts.get_voice_by_role("dialogue_a")
             voice_b = voice_b or self.tts.get_voice_by_role("dialogue_b")
 
-            output_path = Path(output_path)
+            if not isinstance(output_path, Path):
+                output_path = Path(output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            segments: List[Path] = []
-            segment_index = 0
-
-            # 1. Expressions 部分
-            expressions = keypoint.get("expressions", [])
-            if expressions:
-                # 引导语
-                lead_in = self._synthesize_segment(
-                    text="Key expressions",
-                    voice=narrator_voice,
-                    speed=speed,
-                    index=segment_index
-                )
-                segments.append(lead_in)
-                segment_index += 1
-
-                # 引导语后留白
-                silence_1s = self._generate_silence(lead_in_silence)
-                segments.append(silence_1s)
-
-                # 内容
-                phrases = [expr.get("phrase", "") for expr in expressions]
-                content_text = ". ".join(p for p in phrases if p)
-                if content_text:
-                    content = self._synthesize_segment(
-                        text=content_text,
-                        voice=narrator_voice,
-                        speed=speed,
-                        index=segment_index
-                    )
-                    segments.append(content)
-                    segment_index += 1
+            # 1. 规划片段顺序（不调用 TTS）
+            plan = self._plan_segments(
+                keypoint,
+                narrator_voice=narrator_voice,
+                voice_a=voice_a,
+                voice_b=voice_b,
+                lead_in_silence=lead_in_silence,
+                section_silence=section_silence,
+                dialogue_silence=dialogue_silence,
+                merge_speaker_runs=merge_speaker_runs,
+                speaker_run_separator=speaker_run_separator
+            )
 
-                # 内容后留白
-                silence_2s = self._generate_silence(section_silence)
-                segments.append(silence_2s)
-
-            # 2. Alternatives 部分
-            alternatives = keypoint.get("alternatives", [])
-            if alternatives:
-                # 引导语
-                lead_in = self._synthesize_segment(
-                    text="You can also say",
-                    voice=narrator_voice,
-                    speed=speed,
-                    index=segment_index
-                )
-                segments.append(lead_in)
-                segment_index += 1
-
-                # 引导语后留白
-                silence_1s = self._generate_silence(lead_in_silence)
-                segments.append(silence_1s)
-
-                # 内容
-                content_text = ". ".join(alt for alt in alternatives if alt)
-                if content_text:
-                    content = self._synthesize_segment(
-                        text=content_text,
-                        voice=narrator_voice,
-                        speed=speed,
-                        index=segment_index
-                    )
-                    segments.append(content)
-                    segment_index += 1
+            # 末尾留白之后没有内容，无需生成和拼接
+            while plan and plan[-1][0] == "silence":
+                plan.pop()
 
-                # 内容后留白
-                silence_2s = self._generate_silence(section_silence)
-                segments.append(silence_2s)
-
-            # 3. Dialogues 部分
-            examples = keypoint.get("examples", [])
-            if examples:
-                # 引导语
-                lead_in = self._synthesize_segment(
-                    text="Dialogue",
-                    voice=narrator_voice,
-                    speed=speed,
-                    index=segment_index
-                )
-                segments.append(lead_in)
-                segment_index += 1
-
-                # 引导语后留白
-                silence_1s = self._generate_silence(lead_in_silence)
-                segments.append(silence_1s)
-
-                # 对话内容
-                silence_05s = self._generate_silence(dialogue_silence)
-                for example in examples:
-                    dialogue = example.get("dialogue", [])
-                    for line in dialogue:
-                        if ":" in line:
-                            speaker, text = line.split(":", 1)
-                            speaker = speaker.strip()
-                            text = text.strip()
-
-                            if not text:
-                                continue
-
-                            # A = EricNeural (男声), B = JennyNeural (女声)
-                            voice = voice_a if speaker.upper() == "A" else voice_b
-
-                            segment = self._synthesize_segment(
-                                text=text,
-                                voice=voice,
-                                speed=speed,
-                                index=segment_index
-                            )
-                            segments.append(segment)
-                            segment_index += 1
-
-                            # 对话行之间留白
-                            segments.append(silence_05s)
-
-            if not segments:
+            if not plan:
                 return CompositionResult(
                     success=False,
                     error_message="No audio content to compose"
                 )
 
-            # 4. 拼接所有片段
+            # 2. 并发合成所有语音片段（写入本次调用的独立目录）
+            call_dir = Path(tempfile.mkdtemp(dir=self.temp_dir))
+            segments, duration = self._render_plan(plan, speed, call_dir)
+
+            # 3. 拼接所有片段
             final_audio = self._concatenate_segments(segments, output_path)
 
-            # 5. 获取时长
-            duration = get_audio_duration(final_audio, self.ffmpeg_path)
+            # 4. 时长已由片段累加得到，抽样与实际探测结果比对
+            if self.DURATION_CHECK_RATE > 0 and random.random() < self.DURATION_CHECK_RATE:
+                self._check_duration(final_audio, duration)
 
             return CompositionResult(
                 success=True,
@@ -257,30 +241,333 @@ class AudioComposer:
                 error_message=str(e)
             )
 
+        finally:
+            if call_dir is not None:
+                shutil.rmtree(call_dir, ignore_errors=True)
+
+    def compose_batch(
+        self,
+        keypoints: List[dict],
+        output_paths: List[Path],
+        max_parallel: int = DEFAULT_BATCH_WORKERS,
+        **kwargs
+    ) -> List[CompositionResult]:
+        """
+        批量合成多个知识点音频
+
+        多个合成交错进行：一个知识点在拼接（ffmpeg，CPU/磁盘）时，
+        下一个知识点的 TTS 请求（网络）已经开始。
+
+        Args:
+            keypoints: 知识点数据列表
+            output_paths: 输出文件路径列表（与 keypoints 一一对应）
+            max_parallel: 同时进行的合成数
+            **kwargs: 传递给 compose_keypoint_audio 的其他参数
+
+        Returns:
+            与 keypoints 顺序一致的 CompositionResult 列表
+        """
+        if len(keypoints) != len(output_paths):
+            raise ValueError("keypoints and output_paths must have the same length")
+
+        with ThreadPoolExecutor(max_workers=max(1, max_parallel)) as executor:
+            futures = [
+                executor.submit(self.compose_keypoint_audio, keypoint, output_path, **kwargs)
+                for keypoint, output_path in zip(keypoints, output_paths)
+            ]
+            return [future.result() for future in futures]
+
+    def _plan_segments(
+        self,
+        keypoint: dict,
+        narrator_voice: str,
+        voice_a: str,
+        voice_b: str,
+        lead_in_silence: float,
+        section_silence: float,
+        dialogue_silence: float,
+        merge_speaker_runs: bool = True,
+        speaker_run_separator: str = ". "
+    ) -> List[Tuple]:
+        """
+        规划音频片段顺序
+
+        Args:
+            keypoint: 知识点数据
+            narrator_voice: 旁白音色
+            voice_a: 对话 A 角色音色
+            voice_b: 对话 B 角色音色
+            lead_in_silence: 引导语后留白时长（秒）
+            section_silence: 内容后留白时长（秒）
+            dialogue_silence: 对话行之间留白时长（秒）
+            merge_speaker_runs: 是否合并同一角色的连续台词
+            speaker_run_separator: 合并台词时的分隔符（不支持 SSML 时使用）
+
+        Returns:
+            片段列表，元素为 ("speech", text, voice) 或 ("silence", duration)
+        """
+        plan: List[Tuple] = []
+        # 支持 SSML 时，引导语、内容和留白合并为一次 TTS 请求
+        ssml = getattr(self.tts, "supports_ssml", False)
+
+        # 1. Expressions 部分
+        expressions = keypoint.get("expressions", [])
+        if expressions:
+            phrases = [expr.get("phrase", "") for expr in expressions]
+            self._plan_section(
+                plan, "Key expressions", ". ".join(p for p in phrases if p),
+                narrator_voice, lead_in_silence, section_silence, ssml
+            )
+
+        # 2. Alternatives 部分
+        alternatives = keypoint.get("alternatives", [])
+        if alternatives:
+            self._plan_section(
+                plan, "You can also say", ". ".join(alt for alt in alternatives if alt),
+                narrator_voice, lead_in_silence, section_silence, ssml
+            )
+
+        # 3. Dialogues 部分
+        examples = keypoint.get("examples", [])
+        if examples:
+            # 引导语 + 留白
+            if ssml:
+                plan.append(("speech", self._to_ssml(["Dialogue", lead_in_silence]), narrator_voice))
+            else:
+                plan.append(("speech", "Dialogue", narrator_voice))
+                plan.append(("silence", lead_in_silence))
+
+            for example in examples:
+                lines = self._parse_dialogue(example.get("dialogue", []), voice_a, voice_b)
+
+                # 同一角色的连续台词（多句发言、独白）合并为一个片段
+                if merge_speaker_runs:
+                    runs = [
+                        (voice, [text for _, text in group])
+                        for voice, group in groupby(lines, key=lambda line: line[0])
+                    ]
+                else:
+                    runs = [(voice, [text]) for voice, text in lines]
+
+                for voice, texts in runs:
+                    if ssml:
+                        parts: List[Union[str, float]] = []
+                        for text in texts:
+                            if parts:
+                                parts.append(dialogue_silence)
+                            parts.append(text)
+                        plan.append(("speech", self._to_ssml(parts), voice))
+                    else:
+                        plan.append(("speech", self._join_run(texts, speaker_run_separator), voice))
+
+                    # 对话行之间留白
+                    plan.append(("silence", dialogue_silence))
+
+        return plan
+
+    @staticmethod
+    def _parse_dialogue(dialogue: List[str], voice_a: str, voice_b: str) -> List[Tuple[str, str]]:
+        """
+        解析对话行
+
+        Args:
+            dialogue: 形如 "A: text" 的对话行列表
+            voice_a: 对话 A 角色音色
+            voice_b: 对话 B 角色音色
+
+        Returns:
+            [(voice, text), ...]，跳过格式不正确或内容为空的行
+        """
+        lines = []
+        for line in dialogue:
+            if ":" not in line:
+                continue
+            speaker, text = line.split(":", 1)
+            speaker = speaker.strip()
+            text = text.strip()
+
+            if not text:
+                continue
+
+            # A = EricNeural (男声), B = JennyNeural (女声)
+            voice = voice_a if speaker.upper() == "A" else voice_b
+            lines.append((voice, text))
+        return lines
+
+    @staticmethod
+    def _join_run(texts: List[str], separator: str) -> str:
+        """
+        拼接同一角色的连续台词
+
+        Args:
+            texts: 台词列表
+            separator: 分隔符（前一句已以 .!? 结尾时只补空格）
+
+        Returns:
+            拼接后的文本
+        """
+        joined = texts[0]
+        for text in texts[1:]:
+            joined += " " if joined.endswith((".", "!", "?")) else separator
+            joined += text
+        return joined
+
+    @classmethod
+    def _plan_section(
+        cls,
+        plan: List[Tuple],
+        lead_in_text: str,
+        content_text: str,
+        voice: str,
+        lead_in_silence: float,
+        section_silence: float,
+        ssml: bool = False
+    ) -> None:
+        """
+        规划一个段落：引导语 [留白] 内容 [留白]
+
+        Args:
+            plan: 片段列表（原地追加）
+            lead_in_text: 引导语
+            content_text: 内容文本（为空时只保留引导语）
+            voice: 音色
+            lead_in_silence: 引导语后留白时长（秒）
+            section_silence: 内容后留白时长（秒）
+            ssml: 是否用一个 SSML 片段表示整个段落
+        """
+        if ssml:
+            parts: List[Union[str, float]] = [lead_in_text, lead_in_silence]
+            if content_text:
+                parts.append(content_text)
+            parts.append(section_silence)
+            plan.append(("speech", cls._to_ssml(parts), voice))
+            return
+
+        plan.append(("speech", lead_in_text, voice))
+        plan.append(("silence", lead_in_silence))
+        if content_text:
+            plan.append(("speech", content_text, voice))
+        plan.append(("silence", section_silence))
+
+    @staticmethod
+    def _to_ssml(parts: List[Union[str, float]]) -> str:
+        """
+        构造 SSML 文本
+
+        Args:
+            parts: 文本（str）与留白时长（秒，float）交替组成的列表
+
+        Returns:
+            <speak>...</speak> 格式的 SSML
+        """
+        body = "".join(
+            xml_escape(part) if isinstance(part, str)
+            else f'<break time="{int(part * 1000)}ms"/>'
+            for part in parts
+        )
+        return f"<speak>{body}</speak>"
+
+    def _render_plan(
+        self,
+        plan: List[Tuple],
+        speed: float,
+        work_dir: Path
+    ) -> Tuple[List[Path], float]:
+        """
+        按规划生成片段文件，语音片段并发合成
+
+        TTS 调用是 I/O 密集型（网络请求），并发后总耗时约等于最慢的一次调用。
+        各 provider 每次调用都独立建立连接，可安全地在多个线程中使用。
+
+        所有片段统一为同一采样率的单声道 PCM WAV，拼接时逐字节连接，
+        只在最后编码一次。
+
+        Args:
+            plan: _plan_segments 返回的片段列表
+            speed: 语速
+            work_dir: 本次合成的临时目录
+
+        Returns:
+            (按规划顺序排列的片段路径列表, 总时长（秒）)
+        """
+        sample_rate = getattr(self.tts, "output_sample_rate", 16000)
+        futures: Dict[int, Future] = {}
+        rendered: Dict[int, Tuple[Path, float]] = {}
+
+        segment_index = 0
+        try:
+            for position, entry in enumerate(plan):
+                if entry[0] == "speech":
+                    _, text, voice = entry
+                    futures[position] = self._executor.submit(
+                        self._synthesize_segment, text, voice, speed, sample_rate,
+                        segment_index, work_dir
+                    )
+                    segment_index += 1
+                else:
+                    rendered[position] = (self._generate_silence(entry[1], sample_rate), entry[1])
+
+            # 按规划顺序收集结果，保证拼接顺序不变
+            for position, future in futures.items():
+                rendered[position] = future.result()
+        finally:
+            # 出错时取消尚未开始的片段，并等待已开始的片段写完，之后才能删除 work_dir
+            for future in futures.values():
+                future.cancel()
+            wait(futures.values())
+
+        ordered = [rendered[position] for position in range(len(plan))]
+        segments = [path for path, _ in ordered]
+        duration = sum(seconds for _, seconds in ordered)
+        return segments, duration
+
+    def _check_duration(self, audio_path: Path, expected: float) -> None:
+        """
+        探测成品实际时长，与累加值偏差过大时输出警告
+
+        Args:
+            audio_path: 成品音频路径
+            expected: 累加得到的时长（秒）
+        """
+        actual = get_audio_duration(audio_path, self.ffmpeg_path)
+        if abs(actual - expected) > self.DURATION_CHECK_TOLERANCE:
+            print(f"Warning: summed duration {expected:.2f}s differs from probed {actual:.2f}s for {audio_path}")
+
     def _synthesize_segment(
         self,
         text: str,
         voice: str,
         speed: float,
-        index: int
-    ) -> Path:
+        sample_rate: int,
+        index: int,
+        work_dir: Path
+    ) -> Tuple[Path, float]:
         """
-        合成单个音频片段
+        合成单个音频片段，并解码为 PCM WAV
 
         Args:
             text: 文本
             voice: 音色
             speed: 语速
+            sample_rate: 片段采样率
             index: 片段索引
+            work_dir: 本次合成的临时目录
 
         Returns:
-            音频文件路径
+            (WAV 文件路径, 时长（秒）)
         """
-        output_path = self.temp_dir / f"segment_{index}.mp3"
+        output_path = work_dir / f"segment_{index}.wav"
+
+        cache_key = self._segment_cache_key(text, voice, speed, sample_rate)
+        if self._load_cached_segment(cache_key, output_path):
+            return output_path, get_wav_duration(output_path)
 
+        # Provider 能直接输出 PCM WAV 时无需解码；否则输出 MP3，解码后丢弃
+        native_wav = getattr(self.tts, "supports_wav_output", False)
+        tts_path = output_path if native_wav else work_dir / f"segment_{index}.mp3"
         result = self.tts.synthesize(
             text=text,
-            output_path=output_path,
+            output_path=tts_path,
             voice=voice,
             speed=speed
         )
@@ -288,43 +575,202 @@ class AudioComposer:
         if not result.success:
             raise RuntimeError(f"TTS synthesis failed: {result.error_message}")
 
-        return output_path
+        if not native_wav:
+            self._decode_to_wav(tts_path, output_path, sample_rate)
+            tts_path.unlink(missing_ok=True)
 
-    def _generate_silence(self, duration: float) -> Path:
+        self._store_cached_segment(cache_key, output_path)
+        return output_path, get_wav_duration(output_path)
+
+    def _decode_to_wav(self, input_path: Path, output_path: Path, sample_rate: int) -> None:
         """
-        生成空白音频
+        将 TTS 输出解码为单声道 16-bit PCM WAV
 
         Args:
-            duration: 时长（秒）
-
-        Returns:
-            空白音频文件路径
+            input_path: TTS 输出文件路径
+            output_path: WAV 输出路径
+            sample_rate: 目标采样率
         """
-        output_path = self.temp_dir / f"silence_{duration}.mp3"
-
-        if output_path.exists():
-            return output_path
-
         cmd = [
             self.ffmpeg_path,
-            "-f", "lavfi",
-            "-i", f"anullsrc=r=16000:cl=mono",
-            "-t", str(duration),
+            *FFMPEG_QUIET_ARGS,
+            "-i", os.fspath(input_path),
+            "-ac", "1",
+            "-ar", str(sample_rate),
+            "-c:a", "pcm_s16le",
             "-y",
-            str(output_path)
+            os.fspath(output_path)
         ]
 
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             timeout=30
         )
 
         if result.returncode != 0:
-            raise RuntimeError(f"Failed to generate silence: {result.stderr}")
+            raise RuntimeError(f"Failed to decode TTS output: {decode_stderr(result.stderr)}")
 
-        return output_path
+    def _segment_cache_key(self, text: str, voice: str, speed: float, sample_rate: int) -> str:
+        """
+        计算片段缓存键
+
+        Args:
+            text: 文本
+            voice: 音色
+            speed: 语速
+            sample_rate: 片段采样率
+
+        Returns:
+            sha256 十六进制摘要
+        """
+        provider = getattr(self.tts, "provider_name", "")
+        raw = f"{provider}|{voice}|{speed}|{sample_rate}|{text}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _load_cached_segment(self, key: str, output_path: Path) -> bool:
+        """
+        从缓存中取出片段（硬链接，跨文件系统时复制）
+
+        Args:
+            key: 缓存键
+            output_path: 片段输出路径
+
+        Returns:
+            是否命中缓存
+        """
+        if self.max_cache_size <= 0:
+            return False
+
+        cached = self._segment_cache_dir / f"{key}.wav"
+        try:
+            stat = cached.stat()
+        except OSError:
+            return False
+
+        # 过期条目直接删除，按未命中处理
+        if self.cache_ttl is not None and time.time() - stat.st_mtime > self.cache_ttl:
+            cached.unlink(missing_ok=True)
+            return False
+
+        # 条目可能在 stat 之后被其他线程淘汰，此时按未命中处理
+        try:
+            try:
+                os.link(cached, output_path)
+            except OSError:
+                shutil.copyfile(cached, output_path)
+        except OSError:
+            output_path.unlink(missing_ok=True)
+            return False
+
+        # 刷新访问时间，供 LRU 淘汰使用（条目已被淘汰时忽略）
+        try:
+            os.utime(cached)
+        except OSError:
+            pass
+        return True
+
+    def _store_cached_segment(self, key: str, segment_path: Path) -> None:
+        """
+        将新合成的片段原子写入缓存
+
+        Args:
+            key: 缓存键
+            segment_path: 已合成的片段路径
+        """
+        if self.max_cache_size <= 0:
+            return
+
+        cached = self._segment_cache_dir / f"{key}.wav"
+        fd, tmp_name = tempfile.mkstemp(dir=self._segment_cache_dir, suffix=".tmp")
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        try:
+            shutil.copyfile(segment_path, tmp_path)
+            os.replace(tmp_path, cached)
+        except OSError:
+            # 缓存写入失败不影响本次合成
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        # 每写入 CACHE_PRUNE_INTERVAL 个新条目才扫描一次缓存目录
+        with self._cache_prune_lock:
+            self._cache_stores += 1
+            if (self._cache_stores - 1) % self.CACHE_PRUNE_INTERVAL:
+                return
+        self._prune_segment_cache()
+
+    def _prune_segment_cache(self) -> None:
+        """按最近访问时间淘汰超出 max_cache_size 的缓存条目"""
+        entries = []
+        for path in self._segment_cache_dir.glob("*.wav"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+
+        excess = len(entries) - self.max_cache_size
+        if excess <= 0:
+            return
+
+        entries.sort()
+        for _, path in entries[:excess]:
+            path.unlink(missing_ok=True)
+
+    def _generate_silence(self, duration: float, sample_rate: int) -> Path:
+        """
+        生成空白音频（PCM WAV）
+
+        空白片段只与时长和采样率有关，在进程内（类属性）和进程间
+        （系统临时目录）共享。
+
+        Args:
+            duration: 时长（秒）
+            sample_rate: 采样率，与语音片段一致
+
+        Returns:
+            空白音频文件路径
+        """
+        cache_key = (duration, sample_rate)
+
+        cached = self._SILENCE_CACHE.get(cache_key)
+        if cached is not None and cached.exists():
+            return cached
+
+        with self._SILENCE_LOCK:
+            silence_dir = Path(tempfile.gettempdir()) / "audio_composer_silence"
+            silence_dir.mkdir(parents=True, exist_ok=True)
+            output_path = silence_dir / f"silence_{duration}_{sample_rate}.wav"
+
+            if not output_path.exists():
+                self._render_silence(output_path, duration, sample_rate)
+
+            self._SILENCE_CACHE[cache_key] = output_path
+            return output_path
+
+    @staticmethod
+    def _render_silence(output_path: Path, duration: float, sample_rate: int) -> None:
+        """
+        直接写出全零 PCM WAV（先写临时文件再原子替换，供多进程共享）
+
+        Args:
+            output_path: 输出文件路径
+            duration: 时长（秒）
+            sample_rate: 采样率
+        """
+        fd, tmp_name = tempfile.mkstemp(dir=output_path.parent, suffix=".wav")
+        os.close(fd)
+
+        try:
+            with wave.open(tmp_name, "wb") as wav:
+                wav.setnchannels(1)
+                wav.setsampwidth(2)
+                wav.setframerate(sample_rate)
+                wav.writeframes(bytes(2 * round(duration * sample_rate)))
+            os.replace(tmp_name, output_path)
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
 
     def _concatenate_segments(
         self,
@@ -332,41 +778,76 @@ class AudioComposer:
         output_path: Path
     ) -> Path:
         """
-        拼接多个音频片段
+        拼接多个音频片段，并一次性编码为成品
 
         Args:
-            segments: 音频片段路径列表
-            output_path: 输出文件路径
+            segments: WAV 片段路径列表（采样率、声道一致）
+            output_path: 输出文件路径（.wav 时不编码，其余编码为 MP3）
 
         Returns:
             拼接后的音频文件路径
         """
-        # 创建文件列表
-        list_file = self.temp_dir / "concat_list.txt"
-        with open(list_file, "w") as f:
-            for seg in segments:
-                # 需要转义路径中的特殊字符
-                escaped_path = str(seg).replace("'", "'\\''")
-                f.write(f"file '{escaped_path}'\n")
+        as_wav = output_path.suffix.lower() == ".wav"
+
+        # 只有一个片段且无需编码时直接作为成品，不启动 ffmpeg
+        if len(segments) == 1 and as_wav:
+            return self._publish_segment(segments[0], output_path)
+
+        # 文件列表通过 stdin 传给 concat demuxer，不落盘；
+        # 从管道读取时没有基准目录，路径必须是绝对路径
+        seg_paths = [os.path.abspath(os.fspath(seg)) for seg in segments]
+        concat_list = "".join(
+            "file '{}'\n".format(seg.replace("'", "'\\''"))
+            for seg in seg_paths
+        )
+
+        # 片段均为同格式 PCM，拼接是字节级操作；MP3 只在这里编码一次
+        if as_wav:
+            codec_args = ["-c", "copy"]
+        else:
+            codec_args = ["-c:a", "libmp3lame", "-b:a", self.OUTPUT_BITRATE]
 
         cmd = [
             self.ffmpeg_path,
+            *FFMPEG_QUIET_ARGS,
             "-f", "concat",
             "-safe", "0",
-            "-i", str(list_file),
-            "-c", "copy",
+            "-protocol_whitelist", "file,pipe",
+            "-i", "pipe:0",
+            *codec_args,
             "-y",
-            str(output_path)
+            os.fspath(output_path)
         ]
 
         result = subprocess.run(
             cmd,
+            input=os.fsencode(concat_list),
             capture_output=True,
-            text=True,
             timeout=120
         )
 
         if result.returncode != 0:
-            raise RuntimeError(f"Failed to concatenate audio: {result.stderr}")
+            raise RuntimeError(f"Failed to concatenate audio: {decode_stderr(result.stderr)}")
+
+        return output_path
+
+    @staticmethod
+    def _publish_segment(segment: Path, output_path: Path) -> Path:
+        """
+        将单个片段移动为成品文件
+
+        片段可能与缓存文件共用同一 inode（硬链接），此时复制而非移动，
+        避免之后覆盖输出文件时连带改写缓存。
 
+        Args:
+            segment: 片段路径
+            output_path: 输出文件路径
+
+        Returns:
+            输出文件路径
+        """
+        if os.stat(segment).st_nlink > 1:
+            shutil.copyfile(segment, output_path)
+        else:
+            shutil.move(segment, output_path)
         return output_path
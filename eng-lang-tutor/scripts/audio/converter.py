@@ -8,12 +8,17 @@
 - 声道: 单声道
 """
 
+import hashlib
+import json
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, List
 from dataclasses import dataclass
 
-from .utils import get_ffmpeg_path, get_audio_duration
+from .utils import FFMPEG_QUIET_ARGS, decode_stderr, get_ffmpeg_path, get_audio_duration
 
 
 @dataclass
@@ -32,14 +37,144 @@ class AudioConverter:
     SUPPORTED_FORMATS = ["opus", "speex", "aac", "amr"]
     SUPPORTED_SAMPLE_RATES = [8000, 16000]
 
-    def __init__(self, ffmpeg_path: Optional[str] = None):
+    # 默认转换记录目录（便捷函数使用）
+    DEFAULT_CACHE_DIR = Path.home() / ".cache" / "eng-lang-tutor" / "conversions"
+
+    # 扩展名 -> ffmpeg demuxer，显式指定输入格式可跳过格式探测
+    INPUT_FORMATS = {
+        ".mp3": "mp3",
+        ".wav": "wav",
+        ".m4a": "mov",
+        ".flac": "flac",
+        ".ogg": "ogg",
+    }
+    # batch_convert 支持的输入格式
+    INPUT_EXTENSIONS = frozenset(INPUT_FORMATS)
+
+    def __init__(self, ffmpeg_path: Optional[str] = None, cache_dir: Optional[Path] = None):
         """
         初始化转换器
 
         Args:
             ffmpeg_path: ffmpeg 可执行文件路径（默认自动检测）
+            cache_dir: 转换记录目录；指定时输入文件和参数未变、输出也未改动的
+                转换直接复用已有输出，不再调用 ffmpeg（None 表示不缓存）
         """
         self.ffmpeg_path = ffmpeg_path or get_ffmpeg_path()
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _input_args(self, input_path: Path) -> List[str]:
+        """
+        构建 ffmpeg 输入参数（已知扩展名时显式指定格式）
+
+        Args:
+            input_path: 输入文件路径
+
+        Returns:
+            ffmpeg 参数列表
+        """
+        input_format = self.INPUT_FORMATS.get(input_path.suffix.lower())
+        if input_format:
+            return ["-f", input_format, "-i", os.fspath(input_path)]
+        return ["-i", os.fspath(input_path)]
+
+    @staticmethod
+    def _output_cache_key(input_path: Path, *params) -> Optional[str]:
+        """
+        计算转换结果缓存键（输入路径 + 修改时间 + 大小 + 转换参数）
+
+        Args:
+            input_path: 输入文件路径
+            *params: 影响输出的转换参数
+
+        Returns:
+            sha256 十六进制摘要，输入文件不可访问时返回 None
+        """
+        try:
+            stat = input_path.stat()
+        except OSError:
+            return None
+        raw = "|".join([
+            os.path.abspath(os.fspath(input_path)),
+            str(stat.st_mtime_ns),
+            str(stat.st_size),
+            *(str(param) for param in params)
+        ])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _cache_record_path(self, output_path: Path) -> Path:
+        """获取输出文件对应的转换记录路径（位于 cache_dir，不写入输出目录）"""
+        name = hashlib.sha256(os.path.abspath(os.fspath(output_path)).encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{name}.json"
+
+    def remove_output(self, output_path: Path) -> None:
+        """
+        删除转换输出及其转换记录（文件不存在时忽略）
+
+        Args:
+            output_path: 输出文件路径
+        """
+        output_path.unlink(missing_ok=True)
+        if self.cache_dir is not None:
+            self._cache_record_path(output_path).unlink(missing_ok=True)
+
+    def _load_cached_output(self, output_path: Path, key: Optional[str]) -> Optional[ConversionResult]:
+        """
+        查找可复用的转换结果
+
+        Args:
+            output_path: 输出文件路径
+            key: 缓存键
+
+        Returns:
+            命中时返回 ConversionResult，否则返回 None
+        """
+        if self.cache_dir is None or key is None:
+            return None
+
+        try:
+            record = json.loads(self._cache_record_path(output_path).read_text(encoding="utf-8"))
+            stat = output_path.stat()
+        except (OSError, ValueError):
+            return None
+
+        # 输出文件被删除或改写过时重新转换
+        if record.get("key") != key or record.get("output") != [stat.st_mtime_ns, stat.st_size]:
+            return None
+
+        return ConversionResult(
+            success=True,
+            output_path=output_path,
+            duration_seconds=record.get("duration")
+        )
+
+    def _store_cached_output(self, output_path: Path, key: Optional[str], duration: float) -> None:
+        """
+        记录转换结果，供下次复用
+
+        Args:
+            output_path: 输出文件路径
+            key: 缓存键
+            duration: 输出时长（秒）
+        """
+        if self.cache_dir is None or key is None:
+            return
+
+        try:
+            stat = output_path.stat()
+            self._cache_record_path(output_path).write_text(
+                json.dumps({
+                    "key": key,
+                    "output": [stat.st_mtime_ns, stat.st_size],
+                    "duration": duration
+                }),
+                encoding="utf-8"
+            )
+        except OSError:
+            # 缓存写入失败不影响转换结果
+            pass
 
     def convert_to_voice(
         self,
@@ -47,7 +182,9 @@ class AudioConverter:
         output_path: Optional[Path] = None,
         format: str = "opus",
         sample_rate: int = 16000,
-        bitrate: str = "24k"
+        bitrate: str = "24k",
+        known_duration: Optional[float] = None,
+        threads: int = 0
     ) -> ConversionResult:
         """
         将音频文件转换为飞书语音格式
@@ -58,6 +195,8 @@ class AudioConverter:
             format: 输出格式（opus, speex, aac, amr）
             sample_rate: 采样率（8000 或 16000）
             bitrate: 比特率（默认 24k，适合语音）
+            known_duration: 已知的输入时长（秒），提供时不再探测输出文件
+            threads: ffmpeg 线程数（0 = 自动；多个转换并行时传 1 避免超额订阅）
 
         Returns:
             ConversionResult: 转换结果
@@ -75,7 +214,8 @@ class AudioConverter:
                 error_message=f"Unsupported sample rate: {sample_rate}. Supported: {self.SUPPORTED_SAMPLE_RATES}"
             )
 
-        input_path = Path(input_path)
+        if not isinstance(input_path, Path):
+            input_path = Path(input_path)
         if not input_path.exists():
             return ConversionResult(
                 success=False,
@@ -85,9 +225,15 @@ class AudioConverter:
         # 确定输出路径
         if output_path is None:
             output_path = input_path.with_suffix(f".{format}")
-        else:
+        elif not isinstance(output_path, Path):
             output_path = Path(output_path)
 
+        # 输入和参数未变时直接复用上次的输出
+        cache_key = self._output_cache_key(input_path, "voice", format, sample_rate, bitrate)
+        cached = self._load_cached_output(output_path, cache_key)
+        if cached is not None:
+            return cached
+
         # 确保输出目录存在
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -101,39 +247,45 @@ class AudioConverter:
 
         cmd = [
             self.ffmpeg_path,
-            "-i", str(input_path),      # 输入文件
+            *FFMPEG_QUIET_ARGS,
+            *self._input_args(input_path),  # 输入文件
             "-acodec", codec_map[format],  # 编码器
             "-ar", str(sample_rate),    # 采样率
             "-ac", "1",                 # 单声道
             "-ab", bitrate,             # 比特率
-            "-y",                       # 覆盖输出文件
-            str(output_path)
+            "-threads", str(threads),   # 编码线程数（0 = 自动）
         ]
 
-        # 特定格式优化
+        # 特定格式优化（输出选项必须位于输出路径之前才会生效）
         if format == "opus":
-            # Opus 针对语音优化
-            cmd.extend(["-application", "audio"])
+            # Opus 针对语音优化；VBR 在相同平均码率下音质更好，
+            # compression_level 10 以更多 CPU 换取更高编码效率
+            cmd.extend(["-application", "audio", "-vbr", "on", "-compression_level", "10"])
         elif format == "speex":
             # Speex 针对语音优化
             cmd.extend(["-compression_level", "10"])
 
+        cmd.extend([
+            "-y",                       # 覆盖输出文件
+            os.fspath(output_path)
+        ])
+
         try:
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=60  # 60秒超时
             )
 
             if result.returncode != 0:
                 return ConversionResult(
                     success=False,
-                    error_message=f"ffmpeg error: {result.stderr}"
+                    error_message=f"ffmpeg error: {decode_stderr(result.stderr)}"
                 )
 
-            # 获取音频时长
-            duration = get_audio_duration(output_path, self.ffmpeg_path)
+            # 获取音频时长（转码不改变时长，已知时无需再启动 ffmpeg）
+            duration = known_duration or get_audio_duration(output_path, self.ffmpeg_path)
+            self._store_cached_output(output_path, cache_key, duration)
 
             return ConversionResult(
                 success=True,
@@ -157,16 +309,23 @@ class AudioConverter:
         input_dir: Path,
         output_dir: Optional[Path] = None,
         format: str = "opus",
-        sample_rate: int = 16000
+        sample_rate: int = 16000,
+        bitrate: str = "24k",
+        max_workers: Optional[int] = None
     ) -> dict:
         """
         批量转换目录中的音频文件
 
+        每个文件由独立的 ffmpeg 进程（单线程）编码，多个进程并行运行；
+        输入未变化的文件直接复用上次的输出，不进入线程池。
+
         Args:
             input_dir: 输入目录
             output_dir: 输出目录（可选，默认在输入目录下创建 voice/ 子目录）
             format: 输出格式
             sample_rate: 采样率
+            bitrate: 比特率
+            max_workers: 并行转换数（默认 CPU 核数）
 
         Returns:
             转换结果字典 {原文件名: ConversionResult}
@@ -177,32 +336,55 @@ class AudioConverter:
         else:
             output_dir = Path(output_dir)
 
+        with os.scandir(input_dir) as entries:
+            input_files = [
+                Path(entry.path) for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in self.INPUT_EXTENSIONS
+                and entry.is_file()
+            ]
         results = {}
-
-        # 支持的输入格式
-        input_extensions = [".mp3", ".wav", ".m4a", ".flac", ".ogg"]
-
-        for input_file in input_dir.glob("*"):
-            if input_file.suffix.lower() not in input_extensions:
-                continue
-
+        pending = []
+        for input_file in input_files:
             output_file = output_dir / input_file.with_suffix(f".{format}").name
-            results[input_file.name] = self.convert_to_voice(
-                input_path=input_file,
-                output_path=output_file,
-                format=format,
-                sample_rate=sample_rate
-            )
+            cache_key = self._output_cache_key(input_file, "voice", format, sample_rate, bitrate)
+            cached = self._load_cached_output(output_file, cache_key)
+            if cached is not None:
+                results[input_file.name] = cached
+            else:
+                pending.append((input_file, output_file))
+
+        if not pending:
+            return results
+
+        workers = min(max_workers or os.cpu_count() or 1, len(pending))
+        # 多个 ffmpeg 并行时各用单线程，总线程数不超过并行数
+        threads = 1 if workers > 1 else 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                input_file.name: executor.submit(
+                    self.convert_to_voice,
+                    input_path=input_file,
+                    output_path=output_file,
+                    format=format,
+                    sample_rate=sample_rate,
+                    bitrate=bitrate,
+                    threads=threads
+                )
+                for input_file, output_file in pending
+            }
+            for name, future in futures.items():
+                results[name] = future.result()
 
         return results
 
-
     def convert_to_feishu_voice(
         self,
         input_path: Path,
         output_path: Optional[Path] = None,
         sample_rate: int = 16000,
-        bitrate: str = "24k"
+        bitrate: str = "24k",
+        known_duration: Optional[float] = None,
+        threads: int = 0
     ) -> ConversionResult:
         """
         将音频转换为飞书语音气泡格式 (.m4a + libopus 编码)
@@ -218,11 +400,14 @@ class AudioConverter:
             output_path: 输出文件路径（可选，默认同目录更换扩展名为 .m4a）
             sample_rate: 采样率（默认 16000）
             bitrate: 比特率（默认 24k）
+            known_duration: 已知的输入时长（秒），提供时不再探测输出文件
+            threads: ffmpeg 线程数（0 = 自动；多个转换并行时传 1 避免超额订阅）
 
         Returns:
             ConversionResult: 转换结果
         """
-        input_path = Path(input_path)
+        if not isinstance(input_path, Path):
+            input_path = Path(input_path)
         if not input_path.exists():
             return ConversionResult(
                 success=False,
@@ -232,9 +417,15 @@ class AudioConverter:
         # 确定输出路径
         if output_path is None:
             output_path = input_path.with_suffix(".m4a")
-        else:
+        elif not isinstance(output_path, Path):
             output_path = Path(output_path)
 
+        # 输入和参数未变时直接复用上次的输出
+        cache_key = self._output_cache_key(input_path, "feishu", sample_rate, bitrate)
+        cached = self._load_cached_output(output_path, cache_key)
+        if cached is not None:
+            return cached
+
         # 确保输出目录存在
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -242,31 +433,33 @@ class AudioConverter:
         # 使用 -c:a libopus 编码，输出到 .m4a 容器
         cmd = [
             self.ffmpeg_path,
-            "-i", str(input_path),
+            *FFMPEG_QUIET_ARGS,
+            *self._input_args(input_path),
             "-c:a", "libopus",          # Opus 编码器
             "-ar", str(sample_rate),    # 采样率
             "-ac", "1",                 # 单声道
             "-b:a", bitrate,            # 比特率
+            "-threads", str(threads),   # 编码线程数（0 = 自动）
             "-y",                       # 覆盖输出文件
-            str(output_path)
+            os.fspath(output_path)
         ]
 
         try:
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=60
             )
 
             if result.returncode != 0:
                 return ConversionResult(
                     success=False,
-                    error_message=f"ffmpeg error: {result.stderr}"
+                    error_message=f"ffmpeg error: {decode_stderr(result.stderr)}"
                 )
 
-            # 获取音频时长
-            duration = get_audio_duration(output_path, self.ffmpeg_path)
+            # 获取音频时长（转码不改变时长，已知时无需再启动 ffmpeg）
+            duration = known_duration or get_audio_duration(output_path, self.ffmpeg_path)
+            self._store_cached_output(output_path, cache_key, duration)
 
             return ConversionResult(
                 success=True,
@@ -287,9 +480,16 @@ class AudioConverter:
 
 
 # 便捷函数
+@lru_cache(maxsize=1)
+def _get_default_converter() -> AudioConverter:
+    """便捷函数共用的默认转换器（进程内只创建一次，重复转换同一文件时复用输出）"""
+    return AudioConverter(cache_dir=AudioConverter.DEFAULT_CACHE_DIR)
+
+
 def convert_mp3_to_opus(
     input_path: Path,
-    output_path: Optional[Path] = None
+    output_path: Optional[Path] = None,
+    known_duration: Optional[float] = None
 ) -> ConversionResult:
     """
     将 MP3 转换为 Opus 格式（飞书推荐）
@@ -297,22 +497,25 @@ def convert_mp3_to_opus(
     Args:
         input_path: MP3 文件路径
         output_path: 输出路径（可选）
+        known_duration: 已知的输入时长（秒，可选）
 
     Returns:
         ConversionResult
     """
-    converter = AudioConverter()
+    converter = _get_default_converter()
     return converter.convert_to_voice(
         input_path=input_path,
         output_path=output_path,
         format="opus",
-        sample_rate=16000
+        sample_rate=16000,
+        known_duration=known_duration
     )
 
 
 def convert_to_feishu_voice(
     input_path: Path,
-    output_path: Optional[Path] = None
+    output_path: Optional[Path] = None,
+    known_duration: Optional[float] = None
 ) -> ConversionResult:
     """
     将音频转换为飞书语音气泡格式 (.m4a + libopus)
@@ -320,12 +523,14 @@ def convert_to_feishu_voice(
     Args:
         input_path: 输入文件路径
         output_path: 输出路径（可选，默认 .m4a）
+        known_duration: 已知的输入时长（秒，可选）
 
     Returns:
         ConversionResult
     """
-    converter = AudioConverter()
+    converter = _get_default_converter()
     return converter.convert_to_feishu_voice(
         input_path=input_path,
-        output_path=output_path
+        output_path=output_path,
+        known_duration=known_duration
     )
@@ -21,17 +21,57 @@
         keypoint=keypoint,
         audio_info=audio_info
     )
+
+批量发送时建议使用 async with，在上下文内所有请求共享一个 HTTP 会话
+（复用 TCP/TLS 连接），退出时自动关闭：
+
+    async with FeishuVoiceSender(app_id="xxx", app_secret="xxx") as sender:
+        await sender.send_keypoint_voices(...)
+
+不使用 async with 时每个请求使用独立的会话并在请求结束后关闭，发送器可以
+在多次 asyncio.run(...) 之间复用。
+
+在同步代码中可使用 utils.run_async(...) 运行上述协程，安装了 uvloop 时
+会自动使用 uvloop 事件循环。
 """
 
+import functools
+import hashlib
+import json
 import os
+import random
+import threading
+import time
+import uuid
 import asyncio
 import aiohttp
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union, AsyncIterator, Tuple, Set, ClassVar, Callable
 from dataclasses import dataclass
 
 from .converter import AudioConverter, ConversionResult
 
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库
+    orjson = None
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """将对象编码为紧凑的 UTF-8 JSON 字节串（优先使用 orjson）"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class _SizedStreamPayload(aiohttp.payload.AsyncIterablePayload):
+    """已知长度的异步流请求体（aiohttp 据此计算 Content-Length）"""
+
+    def __init__(self, value: AsyncIterator[bytes], size: int, **kwargs: Any):
+        super().__init__(value, **kwargs)
+        self._size = size
+
 
 @dataclass
 class VoiceSendResult:
@@ -54,12 +94,45 @@ class FeishuVoiceSender:
 
     FEISHU_API_BASE = "https://open.feishu.cn/open-apis"
 
+    # HTTP 连接池配置（所有请求共享一个会话，复用 TCP/TLS 连接）
+    HTTP_CONNECTION_LIMIT = 100           # 连接池总连接数
+    HTTP_CONNECTION_LIMIT_PER_HOST = 20   # 单个主机的连接数
+    HTTP_DNS_CACHE_TTL = 300              # DNS 缓存时间（秒）
+    HTTP_KEEPALIVE_TIMEOUT = 75           # 空闲连接保持时间（秒）
+    HTTP_TIMEOUT = 60                     # 单个请求总超时（秒）
+    DEFAULT_UPLOAD_CONCURRENCY = 6        # send_keypoint_voices 并发数
+    UPLOAD_CHUNK_SIZE = 64 * 1024         # 上传时每次读取的字节数
+    TTS_CACHE_MAX_FILES = 200             # send_voice_from_text 的 MP3（及其 Opus）缓存上限（按最近使用淘汰）
+    TTS_CACHE_PRUNE_INTERVAL = 20         # 每写入多少个缓存文件检查一次上限
+    TOKEN_REFRESH_AHEAD = 300             # 在缓存过期前多久后台刷新令牌（秒）
+    TOKEN_REFRESH_RETRY_DELAY = 30        # 后台刷新失败后的重试间隔（秒）
+    HTTP_MAX_ATTEMPTS = 4                 # 瞬时错误（网络、5xx、限流）最多尝试次数
+    HTTP_RETRY_BASE_DELAY = 0.25          # 首次重试前的等待（秒），之后指数增长
+    HTTP_RETRY_MAX_DELAY = 5.0            # 单次重试等待上限（秒），服务端指定时除外
+
+    # 可重试的飞书业务错误码
+    RETRYABLE_ERROR_CODES = frozenset({
+        99991400,  # 请求频率超限
+    })
+
+    # 音频转换专用线程池（所有发送器共享，首次转换时创建）。ffmpeg 在子进程中
+    # 运行，线程只负责等待；按 CPU 核数限制并发，且不与文件读写争用默认线程池
+    _ffmpeg_pool: ClassVar[Optional[ThreadPoolExecutor]] = None
+
+    # 上传文件的 Content-Type
+    UPLOAD_CONTENT_TYPES = {
+        ".opus": "audio/ogg",
+        ".mp3": "audio/mpeg",
+        ".m4a": "audio/mp4",
+    }
+
     def __init__(
         self,
         app_id: Optional[str] = None,
         app_secret: Optional[str] = None,
         tenant_key: Optional[str] = None,
-        audio_dir: Optional[Path] = None
+        audio_dir: Optional[Path] = None,
+        upload_concurrency: Optional[int] = None
     ):
         """
         初始化飞书语音发送器
@@ -69,6 +142,7 @@ class FeishuVoiceSender:
             app_secret: 飞书应用密钥（可从环境变量 FEISHU_APP_SECRET 读取）
             tenant_key: 租户密钥（自建应用无需）
             audio_dir: 音频缓存目录
+            upload_concurrency: 同时上传/发送的语音数（可从环境变量 FEISHU_UPLOAD_CONCURRENCY 读取，默认 6）
         """
         self.app_id = app_id or os.getenv("FEISHU_APP_ID")
         self.app_secret = app_secret or os.getenv("FEISHU_APP_SECRET")
@@ -83,20 +157,126 @@ class FeishuVoiceSender:
         self.audio_dir = audio_dir or Path(
             os.getenv("OPENCLAW_STATE_DIR", "~/.openclaw/state/eng-lang-tutor")
         ).expanduser() / "audio"
-        self.audio_dir.mkdir(parents=True, exist_ok=True)
-
-        self.converter = AudioConverter()
+        # TTS 缓存目录随音频目录一起创建，发送时不再重复 mkdir
+        self.tts_cache_dir = self.audio_dir / "cache"
+        self.tts_cache_dir.mkdir(parents=True, exist_ok=True)
+        self._tts_cache_lock = threading.Lock()
+        self._tts_cache_stores = 0
+
+        self.upload_concurrency = max(1, upload_concurrency or int(
+            os.getenv("FEISHU_UPLOAD_CONCURRENCY", self.DEFAULT_UPLOAD_CONCURRENCY)
+        ))
+
+        # 同一 MP3 再次发送时复用已转换的 Opus（转换记录存放在 TTS 缓存目录下）
+        self.converter = AudioConverter(cache_dir=self.tts_cache_dir / "conversions")
         self._access_token: Optional[str] = None
         self._token_expires: float = 0
+        # 共享会话仅在 async with 内使用，绑定创建它的事件循环
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._context_depth = 0
+        # 已上传文件：(路径, 修改时间, 大小, 类型) -> file_key
+        self._file_key_cache: Dict[Tuple[str, int, int, str], str] = {}
+        # 在首次使用时创建（需在事件循环内）
+        self._token_lock: Optional[asyncio.Lock] = None
+        self._refresh_task: Optional[asyncio.Future] = None
+
+    async def __aenter__(self):
+        """异步上下文管理器入口，之后的请求共享一个 HTTP 会话"""
+        self._bind_loop()
+        self._context_depth += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """异步上下文管理器退出，关闭 HTTP 会话"""
+        self._context_depth -= 1
+        if self._context_depth == 0:
+            await self.aclose()
+        return False
+
+    async def aclose(self) -> None:
+        """停止令牌刷新任务并关闭共享的 HTTP 会话"""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._refresh_task = None
+
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _bind_loop(self) -> None:
+        """
+        将事件循环相关的状态绑定到当前运行的事件循环
+
+        发送器在另一个事件循环中复用时（例如多次 asyncio.run），旧循环上
+        创建的会话、锁和刷新任务已不可用，丢弃后在当前循环中重新创建。
+        """
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        if self._session is not None:
+            # 旧循环已结束，无法再 await close()；分离连接器避免误报未关闭
+            self._session.detach()
+        self._session = None
+        self._token_lock = None
+        self._refresh_task = None
+        self._context_depth = 0
+        self._loop = loop
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """创建带连接池配置的 HTTP 会话"""
+        connector = aiohttp.TCPConnector(
+            limit=self.HTTP_CONNECTION_LIMIT,
+            limit_per_host=self.HTTP_CONNECTION_LIMIT_PER_HOST,
+            ttl_dns_cache=self.HTTP_DNS_CACHE_TTL,
+            keepalive_timeout=self.HTTP_KEEPALIVE_TIMEOUT
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.HTTP_TIMEOUT)
+        )
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        获取 async with 内共享的 HTTP 会话（首次调用时创建）
+
+        检查和创建之间没有 await，在单个事件循环内不会重复创建。
+
+        Returns:
+            aiohttp.ClientSession
+        """
+        self._bind_loop()
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+        return self._session
 
     async def _get_access_token(self) -> str:
         """获取飞书访问令牌"""
-        import time
-
-        # 检查缓存
+        # 检查缓存（后台任务会在过期前刷新，热路径通常直接返回）
         if self._access_token and time.time() < self._token_expires:
             return self._access_token
 
+        self._bind_loop()
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+
+        # 并发请求只获取一次令牌
+        async with self._token_lock:
+            if not self._access_token or time.time() >= self._token_expires:
+                await self._fetch_access_token()
+
+        # 后台刷新只在 async with 内运行，由 aclose() 负责取消
+        if self._context_depth and (self._refresh_task is None or self._refresh_task.done()):
+            self._refresh_task = asyncio.ensure_future(self._refresh_token_periodically())
+
+        return self._access_token
+
+    async def _fetch_access_token(self) -> None:
+        """请求新的访问令牌并更新缓存"""
         url = f"{self.FEISHU_API_BASE}/auth/v3/tenant_access_token/internal"
         headers = {"Content-Type": "application/json"}
         data = {
@@ -104,17 +284,35 @@ class FeishuVoiceSender:
             "app_secret": self.app_secret
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=data) as resp:
-                result = await resp.json()
+        body = _json_bytes(data)
+        result = await self._post_json(url, lambda: {"headers": headers, "data": body})
+
+        if result.get("code") != 0:
+            raise RuntimeError(f"Failed to get access token: {result}")
 
-                if result.get("code") != 0:
-                    raise RuntimeError(f"Failed to get access token: {result}")
+        self._access_token = result["tenant_access_token"]
+        self._token_expires = time.time() + result.get("expire", 7200) - 300
 
-                self._access_token = result["tenant_access_token"]
-                self._token_expires = time.time() + result.get("expire", 7200) - 300
+    async def _refresh_token_periodically(self) -> None:
+        """
+        后台任务：在令牌过期前提前刷新，避免发送请求时等待鉴权
 
-                return self._access_token
+        仅在 async with 内启动；未使用上下文管理器时，令牌在过期前
+        由 _get_access_token 按需获取。
+        """
+        while True:
+            delay = self._token_expires - self.TOKEN_REFRESH_AHEAD - time.time()
+            await asyncio.sleep(max(delay, 0))
+
+            try:
+                async with self._token_lock:
+                    await self._fetch_access_token()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 刷新失败时稍后重试；令牌真正过期前热路径仍会自行获取
+                print(f"Warning: background token refresh failed: {e}")
+                await asyncio.sleep(self.TOKEN_REFRESH_RETRY_DELAY)
 
     async def _upload_file(self, file_path: Path, file_type: str = "opus") -> str:
         """
@@ -127,25 +325,87 @@ class FeishuVoiceSender:
         Returns:
             file_key
         """
+        # 同一文件（路径、修改时间、大小均未变）在本会话内只上传一次
+        stat = await self._run_blocking(file_path.stat)
+        cache_key = (os.fspath(file_path), stat.st_mtime_ns, stat.st_size, file_type)
+        file_key = self._file_key_cache.get(cache_key)
+        if file_key is not None:
+            return file_key
+
         token = await self._get_access_token()
 
         url = f"{self.FEISHU_API_BASE}/im/v1/files"
         headers = {"Authorization": f"Bearer {token}"}
 
-        async with aiohttp.ClientSession() as session:
-            with open(file_path, "rb") as f:
-                form = aiohttp.FormData()
-                form.add_field("file_type", file_type)
-                form.add_field("file_name", file_path.name)
-                form.add_field("file", f, filename=file_path.name)
+        content_type = self.UPLOAD_CONTENT_TYPES.get(
+            file_path.suffix.lower(), "application/octet-stream"
+        )
+
+        def build_request() -> Dict[str, Any]:
+            # 文件内容分块流式上传，内存占用与文件大小无关；每次重试重新读取。
+            # 预先给出文件大小，multipart 请求体带 Content-Length 而非分块编码
+            form = aiohttp.FormData()
+            form.add_field("file_type", file_type)
+            form.add_field("file_name", file_path.name)
+            form.add_field(
+                "file",
+                _SizedStreamPayload(
+                    self._iter_file_chunks(file_path),
+                    size=stat.st_size,
+                    content_type=content_type
+                ),
+                filename=file_path.name,
+                content_type=content_type
+            )
+            return {"headers": headers, "data": form}
+
+        result = await self._post_json(url, build_request)
+
+        if result.get("code") != 0:
+            raise RuntimeError(f"Failed to upload file: {result}")
 
-                async with session.post(url, headers=headers, data=form) as resp:
-                    result = await resp.json()
+        file_key = result["data"]["file_key"]
+        self._file_key_cache[cache_key] = file_key
+        return file_key
 
-                    if result.get("code") != 0:
-                        raise RuntimeError(f"Failed to upload file: {result}")
+    async def _iter_file_chunks(self, file_path: Path) -> AsyncIterator[bytes]:
+        """
+        分块读取文件（读取在线程池中进行，不阻塞事件循环）
 
-                    return result["data"]["file_key"]
+        Args:
+            file_path: 文件路径
+
+        Yields:
+            最多 UPLOAD_CHUNK_SIZE 字节的数据块
+        """
+        loop = asyncio.get_running_loop()
+        f, chunk = await loop.run_in_executor(None, self._open_first_chunk, file_path)
+        try:
+            # 读到不足一块即为文件末尾，语音片段通常一次读完，无需再切换线程
+            while True:
+                yield chunk
+                if len(chunk) < self.UPLOAD_CHUNK_SIZE:
+                    break
+                chunk = await loop.run_in_executor(None, f.read, self.UPLOAD_CHUNK_SIZE)
+        finally:
+            f.close()
+
+    def _open_first_chunk(self, file_path: Path) -> Tuple[Any, bytes]:
+        """
+        打开文件并读取第一块（合并为一次线程池调用）
+
+        Args:
+            file_path: 文件路径
+
+        Returns:
+            (文件对象, 第一块数据)
+        """
+        f = open(file_path, "rb")
+        try:
+            return f, f.read(self.UPLOAD_CHUNK_SIZE)
+        except BaseException:
+            f.close()
+            raise
 
     async def _send_file_message(
         self,
@@ -177,17 +437,111 @@ class FeishuVoiceSender:
         data = {
             "receive_id": receive_id,
             "msg_type": "file",
-            "content": f'{{"file_key": "{file_key}"}}'
+            "content": _json_bytes({"file_key": file_key}).decode("utf-8"),
+            # 重试时使用同一 uuid，飞书据此去重，不会重复发送
+            "uuid": uuid.uuid4().hex
         }
+        body = _json_bytes(data)
+
+        result = await self._post_json(
+            url, lambda: {"headers": headers, "params": params, "data": body}
+        )
+
+        if result.get("code") != 0:
+            raise RuntimeError(f"Failed to send message: {result}")
+
+        return result["data"]["message_id"]
+
+    async def _post_json(
+        self,
+        url: str,
+        build_request: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        发送 POST 请求并返回 JSON 响应，瞬时错误按指数退避（带抖动）重试
+
+        连接错误、超时、HTTP 429/5xx 以及 RETRYABLE_ERROR_CODES 中的业务错误
+        会重试，最多 HTTP_MAX_ATTEMPTS 次；其他响应（包括非 JSON 的 4xx
+        错误页）直接返回，由调用方判断。
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, params=params, json=data) as resp:
-                result = await resp.json()
+        Args:
+            url: 请求地址
+            build_request: 生成 session.post 参数的函数（每次尝试调用一次，
+                请求体为流时需重新创建）
 
-                if result.get("code") != 0:
-                    raise RuntimeError(f"Failed to send message: {result}")
+        Returns:
+            响应 JSON
 
-                return result["data"]["message_id"]
+        Raises:
+            aiohttp.ClientError / asyncio.TimeoutError: 重试耗尽后的网络错误，
+                或其他不可重试的客户端错误
+        """
+        if self._context_depth:
+            return await self._post_json_with(
+                await self._get_session(), url, build_request
+            )
+
+        # 未使用 async with 时每次请求使用独立会话，用完即关闭
+        async with self._create_session() as session:
+            return await self._post_json_with(session, url, build_request)
+
+    async def _post_json_with(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        build_request: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """使用指定会话执行 _post_json 的请求与重试"""
+        for attempt in range(1, self.HTTP_MAX_ATTEMPTS + 1):
+            retry_after = None
+            try:
+                async with session.post(url, **build_request()) as resp:
+                    # 网关返回的 HTML 错误页等非 JSON 响应体按错误结果处理
+                    try:
+                        result = await resp.json(content_type=None)
+                    except ValueError:
+                        result = {"code": -1, "msg": f"HTTP {resp.status}"}
+
+                    if resp.status == 429 or resp.status >= 500:
+                        retry_after = self._parse_retry_after(resp.headers)
+                        retryable = True
+                    else:
+                        # 其他 4xx 等为永久性错误，直接返回
+                        retryable = result.get("code") in self.RETRYABLE_ERROR_CODES
+            except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError):
+                # 仅连接错误、响应体中断和超时重试
+                if attempt == self.HTTP_MAX_ATTEMPTS:
+                    raise
+            else:
+                if not retryable or attempt == self.HTTP_MAX_ATTEMPTS:
+                    return result
+
+            if retry_after is None:
+                retry_after = random.uniform(0.5, 1.0) * min(
+                    self.HTTP_RETRY_MAX_DELAY,
+                    self.HTTP_RETRY_BASE_DELAY * 2 ** (attempt - 1)
+                )
+            await asyncio.sleep(retry_after)
+
+    @staticmethod
+    def _parse_retry_after(headers) -> Optional[float]:
+        """
+        读取限流响应中服务端建议的等待时间
+
+        Args:
+            headers: 响应头
+
+        Returns:
+            等待秒数，未指定时返回 None
+        """
+        for name in ("Retry-After", "x-ogw-ratelimit-reset"):
+            value = headers.get(name)
+            if value is not None:
+                try:
+                    return max(float(value), 0.0)
+                except ValueError:
+                    pass
+        return None
 
     async def send_voice(
         self,
@@ -215,24 +569,12 @@ class FeishuVoiceSender:
 
         try:
             # 如果是 MP3，转换为 Opus
-            if auto_convert and audio_path.suffix.lower() == ".mp3":
-                opus_path = audio_path.with_suffix(".opus")
-                result = self.converter.convert_to_voice(
-                    input_path=audio_path,
-                    output_path=opus_path,
-                    format="opus",
-                    sample_rate=16000
-                )
-                if not result.success:
-                    return VoiceSendResult(
-                        success=False,
-                        error_message=f"Audio conversion failed: {result.error_message}"
-                    )
-                audio_path = opus_path
-                temp_file = opus_path if delete_after_send else None
+            voice_path = await self._run_conversion(self._prepare_voice_file, audio_path, auto_convert)
+            if voice_path != audio_path and delete_after_send:
+                temp_file = voice_path
 
             # 上传文件
-            file_key = await self._upload_file(audio_path)
+            file_key = await self._upload_file(voice_path)
 
             # 发送消息
             message_id = await self._send_file_message(
@@ -253,8 +595,85 @@ class FeishuVoiceSender:
             )
         finally:
             # 清理临时文件
-            if temp_file and temp_file.exists():
-                temp_file.unlink()
+            if temp_file:
+                await self._run_blocking(self.converter.remove_output, temp_file)
+
+    async def broadcast_voice(
+        self,
+        receive_ids: List[str],
+        audio_path: Path,
+        receive_id_type: str = "open_id",
+        auto_convert: bool = True
+    ) -> List[VoiceSendResult]:
+        """
+        将同一条语音发送给多个接收者
+
+        音频只转换、读取和上传一次，得到的 file_key 可重复使用，
+        各接收者的发送请求并发进行（受 upload_concurrency 限制）。
+
+        Args:
+            receive_ids: 接收者 ID 列表
+            audio_path: 音频文件路径（MP3 或 Opus）
+            receive_id_type: 接收者 ID 类型
+            auto_convert: 是否自动转换为 Opus 格式
+
+        Returns:
+            与 receive_ids 一一对应的发送结果列表
+        """
+        if not receive_ids:
+            return []
+
+        try:
+            voice_path = await self._run_conversion(
+                self._prepare_voice_file, Path(audio_path), auto_convert
+            )
+            file_key = await self._upload_file(voice_path)
+        except Exception as e:
+            return [VoiceSendResult(success=False, error_message=str(e)) for _ in receive_ids]
+
+        semaphore = asyncio.Semaphore(self.upload_concurrency)
+
+        async def _send(receive_id: str) -> VoiceSendResult:
+            async with semaphore:
+                try:
+                    message_id = await self._send_file_message(
+                        receive_id=receive_id,
+                        file_key=file_key,
+                        receive_id_type=receive_id_type
+                    )
+                except Exception as e:
+                    return VoiceSendResult(success=False, error_message=str(e))
+                return VoiceSendResult(success=True, message_id=message_id)
+
+        return list(await asyncio.gather(*(_send(receive_id) for receive_id in receive_ids)))
+
+    def _prepare_voice_file(self, audio_path: Path, auto_convert: bool = True) -> Path:
+        """
+        获取可上传的语音文件（MP3 自动转换为 Opus）
+
+        Args:
+            audio_path: 音频文件路径
+            auto_convert: 是否自动转换为 Opus 格式
+
+        Returns:
+            待上传的文件路径
+
+        Raises:
+            RuntimeError: 转换失败
+        """
+        if not (auto_convert and audio_path.suffix.lower() == ".mp3"):
+            return audio_path
+
+        opus_path = audio_path.with_suffix(".opus")
+        result = self.converter.convert_to_voice(
+            input_path=audio_path,
+            output_path=opus_path,
+            format="opus",
+            sample_rate=16000
+        )
+        if not result.success:
+            raise RuntimeError(f"Audio conversion failed: {result.error_message}")
+        return opus_path
 
     async def send_voice_from_text(
         self,
@@ -280,30 +699,33 @@ class FeishuVoiceSender:
         from .tts import TTSManager
 
         try:
-            # 生成 TTS 音频
             manager = TTSManager.from_env()
-            output_path = self.audio_dir / f"temp_{hash(text)}.mp3"
 
-            result = manager.synthesize(
-                text=text,
-                output_path=output_path,
-                voice=voice,
-                speed=speed
-            )
+            # 按内容寻址缓存（内置 hash() 每个进程加盐，不能跨进程复用）
+            digest = hashlib.blake2b(
+                f"{manager.provider_name}|{text}".encode("utf-8"), digest_size=12
+            ).hexdigest()
+            output_path = self.tts_cache_dir / f"{voice}_{speed}_{digest}.mp3"
 
-            if not result.success:
-                return VoiceSendResult(
-                    success=False,
-                    error_message=f"TTS failed: {result.error_message}"
+            # 生成 TTS 音频（已缓存时跳过）
+            if not await self._run_blocking(self._touch_tts_cache, output_path):
+                result = await self._run_blocking(
+                    self._synthesize_to_cache, manager, text, output_path, voice, speed
                 )
 
-            # 发送语音
+                if not result.success:
+                    return VoiceSendResult(
+                        success=False,
+                        error_message=f"TTS failed: {result.error_message}"
+                    )
+
+            # 发送语音（转换出的 Opus 与 MP3 一起保留在缓存中，再次发送时
+            # 由转换记录命中，跳过 ffmpeg；淘汰 MP3 时一并删除）
             return await self.send_voice(
                 receive_id=receive_id,
                 audio_path=output_path,
                 receive_id_type=receive_id_type,
-                auto_convert=True,
-                delete_after_send=True
+                auto_convert=True
             )
 
         except Exception as e:
@@ -312,6 +734,84 @@ class FeishuVoiceSender:
                 error_message=str(e)
             )
 
+    def _touch_tts_cache(self, output_path: Path) -> bool:
+        """
+        检查 TTS 缓存是否命中，命中时刷新访问时间供 LRU 淘汰使用
+
+        只改访问时间：修改时间是转换记录缓存键的一部分，保持不变才能
+        复用已转换的 Opus。
+
+        Args:
+            output_path: 缓存文件路径
+
+        Returns:
+            是否命中缓存
+        """
+        try:
+            stat = output_path.stat()
+            os.utime(output_path, ns=(time.time_ns(), stat.st_mtime_ns))
+        except OSError:
+            return False
+        return True
+
+    def _synthesize_to_cache(
+        self,
+        manager,
+        text: str,
+        output_path: Path,
+        voice: str,
+        speed: float
+    ):
+        """
+        合成到同目录下的临时文件，成功后原子替换为缓存文件
+
+        合成中断或并发合成不会在缓存路径留下不完整的音频。
+
+        Args:
+            manager: TTSManager
+            text: 要转换的文本
+            output_path: 缓存文件路径
+            voice: 音色
+            speed: 语速
+
+        Returns:
+            TTSResult
+        """
+        tmp_path = output_path.with_name(f".{uuid.uuid4().hex}.tmp.mp3")
+        try:
+            result = manager.synthesize(text, tmp_path, voice, speed)
+            if result.success:
+                os.replace(tmp_path, output_path)
+                self._maybe_prune_tts_cache()
+            return result
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def _maybe_prune_tts_cache(self) -> None:
+        """每写入 TTS_CACHE_PRUNE_INTERVAL 个缓存文件检查一次缓存大小"""
+        with self._tts_cache_lock:
+            self._tts_cache_stores += 1
+            if (self._tts_cache_stores - 1) % self.TTS_CACHE_PRUNE_INTERVAL:
+                return
+
+        entries = []
+        for path in self.tts_cache_dir.glob("*.mp3"):
+            if path.name.startswith("."):
+                continue  # 合成中的临时文件
+            try:
+                entries.append((path.stat().st_atime, path))
+            except OSError:
+                continue
+
+        excess = len(entries) - self.TTS_CACHE_MAX_FILES
+        if excess <= 0:
+            return
+
+        entries.sort()
+        for _, path in entries[:excess]:
+            path.unlink(missing_ok=True)
+            self.converter.remove_output(path.with_suffix(".opus"))
+
     async def send_keypoint_voices(
         self,
         receive_id: str,
@@ -335,70 +835,176 @@ class FeishuVoiceSender:
         Returns:
             发送结果列表
         """
-        results = []
-        date_str = audio_info.get("generated_at", "")[:10]  # YYYY-MM-DD
+        # 收集待发送的音频（涉及目录读取，放到线程池中执行）
+        jobs = await self._run_blocking(
+            self._collect_voice_jobs, audio_info, include_dialogue, include_expressions
+        )
 
-        # 发送对话音频
-        if include_dialogue:
-            for item in audio_info.get("dialogue", []):
-                if "error" in item:
-                    results.append(VoiceSendResult(
-                        success=False,
-                        error_message=f"Dialogue generation failed: {item['error']}"
-                    ))
-                    continue
+        if not any(isinstance(job, Path) for job in jobs):
+            return [job for job in jobs if isinstance(job, VoiceSendResult)]
+
+        # 先取得令牌，避免并发请求各自去获取（失败时由各条上传分别报告错误）
+        try:
+            await self._get_access_token()
+        except Exception:
+            pass
+
+        # 1. 各条语音的转换和上传互不依赖，并发进行（受信号量限制）
+        semaphore = asyncio.Semaphore(self.upload_concurrency)
+
+        async def _upload(audio_path: Path) -> str:
+            async with semaphore:
+                voice_path = await self._run_conversion(self._prepare_voice_file, audio_path)
+                return await self._upload_file(voice_path)
+
+        uploads = {
+            index: asyncio.ensure_future(_upload(job))
+            for index, job in enumerate(jobs)
+            if isinstance(job, Path)
+        }
 
-                audio_url = item.get("audio_url", "")
-                if not audio_url:
+        # 2. 按原顺序发送：每条上传完成即发送，后续上传在此期间继续进行，
+        #    发送请求与上传流水线重叠。飞书不支持一次请求发送多条不同消息，
+        #    并发发送又会打乱到达顺序，因此发送本身仍逐条进行。
+        results = []
+        try:
+            for index, job in enumerate(jobs):
+                if isinstance(job, VoiceSendResult):
+                    results.append(job)
                     continue
 
-                # 解析路径：audio/YYYY-MM-DD/filename.opus
-                parts = audio_url.split("/")
-                audio_path = self.audio_dir / parts[1] / parts[2]
+                try:
+                    file_key = await uploads[index]
+                    message_id = await self._send_file_message(
+                        receive_id=receive_id,
+                        file_key=file_key,
+                        receive_id_type=receive_id_type
+                    )
+                except Exception as e:
+                    results.append(VoiceSendResult(success=False, error_message=str(e)))
+                else:
+                    results.append(VoiceSendResult(success=True, message_id=message_id))
+        finally:
+            for task in uploads.values():
+                task.cancel()
 
-                if not audio_path.exists():
-                    # 尝试 MP3 扩展名
-                    audio_path = audio_path.with_suffix(".mp3")
+        return results
 
-                if audio_path.exists():
-                    speaker = item.get("speaker", "")
-                    text = item.get("text", "")
+    def _collect_voice_jobs(
+        self,
+        audio_info: Dict[str, Any],
+        include_dialogue: bool,
+        include_expressions: bool
+    ) -> List[Union[VoiceSendResult, Path]]:
+        """
+        按原顺序收集待发送的音频
 
-                    result = await self.send_voice(
-                        receive_id=receive_id,
-                        audio_path=audio_path,
-                        receive_id_type=receive_id_type,
-                        auto_convert=True
-                    )
-                    results.append(result)
+        Args:
+            audio_info: TTS 生成的音频信息
+            include_dialogue: 是否包含对话音频
+            include_expressions: 是否包含表达音频
 
-        # 发送表达音频
-        if include_expressions:
-            for item in audio_info.get("expressions", []):
+        Returns:
+            音频路径或（生成失败条目的）失败结果列表
+        """
+        # 生成失败的条目直接记为失败结果
+        jobs: List[Union[VoiceSendResult, Path]] = []
+        # 每个日期目录只拼接一次路径、列出一次文件名，代替逐个 exists()
+        listings: Dict[str, Tuple[Path, Set[str]]] = {}
+
+        # (audio_info 中的分类, 是否包含, 失败信息前缀)，按发送顺序排列
+        sections = (
+            ("dialogue", include_dialogue, "Dialogue"),
+            ("expressions", include_expressions, "Expression"),
+        )
+        resolve = self._resolve_audio_path
+
+        for section, included, label in sections:
+            if not included:
+                continue
+            for item in audio_info.get(section, ()):
                 if "error" in item:
-                    results.append(VoiceSendResult(
+                    jobs.append(VoiceSendResult(
                         success=False,
-                        error_message=f"Expression generation failed: {item['error']}"
+                        error_message=f"{label} generation failed: {item['error']}"
                     ))
                     continue
 
-                audio_url = item.get("audio_url", "")
-                if not audio_url:
-                    continue
+                audio_path = resolve(item.get("audio_url", ""), listings)
+                if audio_path is not None:
+                    jobs.append(audio_path)
 
-                parts = audio_url.split("/")
-                audio_path = self.audio_dir / parts[1] / parts[2]
+        return jobs
 
-                if not audio_path.exists():
-                    audio_path = audio_path.with_suffix(".mp3")
+    def _resolve_audio_path(
+        self,
+        audio_url: str,
+        listings: Dict[str, Tuple[Path, Set[str]]]
+    ) -> Optional[Path]:
+        """
+        将 audio_url 解析为本地音频文件路径
 
-                if audio_path.exists():
-                    result = await self.send_voice(
-                        receive_id=receive_id,
-                        audio_path=audio_path,
-                        receive_id_type=receive_id_type,
-                        auto_convert=True
-                    )
-                    results.append(result)
+        Args:
+            audio_url: 形如 audio/YYYY-MM-DD/filename.opus 的相对路径
+            listings: 日期 -> (日期目录, 文件名集合)（按需填充，调用方复用）
 
-        return results
+        Returns:
+            存在的音频文件路径（.opus 不存在时尝试 .mp3），都不存在时返回 None
+        """
+        if not audio_url:
+            return None
+
+        # 解析路径：audio/YYYY-MM-DD/filename.opus
+        _, date_str, filename = audio_url.split("/", 2)
+
+        listing = listings.get(date_str)
+        if listing is None:
+            date_dir = self.audio_dir / date_str
+            try:
+                with os.scandir(date_dir) as entries:
+                    names = {entry.name for entry in entries}
+            except OSError:
+                names = set()
+            listing = listings[date_str] = (date_dir, names)
+        date_dir, names = listing
+
+        if filename not in names:
+            # 尝试 MP3 扩展名
+            filename = os.path.splitext(filename)[0] + ".mp3"
+
+        return date_dir / filename if filename in names else None
+
+    @staticmethod
+    async def _run_blocking(func, *args):
+        """
+        在默认线程池中执行阻塞调用（文件系统等），不阻塞事件循环
+
+        Args:
+            func: 同步函数
+            *args: 位置参数
+
+        Returns:
+            func 的返回值
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args))
+
+    @classmethod
+    async def _run_conversion(cls, func, *args):
+        """
+        在音频转换线程池中执行 ffmpeg 转换，多条语音可在多个核上并行转换
+
+        Args:
+            func: 同步函数
+            *args: 位置参数
+
+        Returns:
+            func 的返回值
+        """
+        if cls._ffmpeg_pool is None:
+            FeishuVoiceSender._ffmpeg_pool = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                thread_name_prefix="ffmpeg"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(cls._ffmpeg_pool, functools.partial(func, *args))
@@ -3,9 +3,12 @@
 TTS Provider 抽象基类 - 所有 TTS 服务必须实现此接口
 """
 
+import asyncio
+import functools
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, ClassVar
+from typing import Optional, Dict, Any, ClassVar, List, Tuple
 from pathlib import Path
 
 
@@ -63,6 +66,10 @@ class TTSProvider(ABC):
     DEFAULT_DIALOGUE_A_VOICE: ClassVar[str] = ""  # 对话 A - 男声
     DEFAULT_DIALOGUE_B_VOICE: ClassVar[str] = ""  # 对话 B - 女声
     SUPPORTED_VOICES: ClassVar[Dict[str, str]] = {}  # voice_id -> description
+    OUTPUT_SAMPLE_RATE: ClassVar[int] = 16000        # 输出音频采样率（Hz）
+    SUPPORTS_SSML: ClassVar[bool] = False            # 是否接受 <speak> SSML 文本（如 <break>）
+    SUPPORTS_WAV_OUTPUT: ClassVar[bool] = False      # output_path 为 .wav 时能否直接输出 PCM WAV
+    BATCH_CONCURRENCY: ClassVar[int] = 4             # synthesize_batch 并发请求数
 
     def __init__(self, config: Optional[TTSConfig] = None, **credentials):
         """
@@ -108,6 +115,65 @@ class TTSProvider(ABC):
         """
         pass
 
+    async def asynthesize(
+        self,
+        text: str,
+        output_path: Path,
+        voice: Optional[str] = None,
+        speed: Optional[float] = None
+    ) -> TTSResult:
+        """
+        异步合成语音
+
+        默认在线程池中执行同步的 synthesize()，原生支持异步的 provider
+        （如 Edge-TTS）可覆盖此方法。
+
+        Args:
+            text: 要合成的文本
+            output_path: 输出文件路径
+            voice: 语音 ID（可选，使用配置中的默认值）
+            speed: 语速（可选，使用配置中的默认值）
+
+        Returns:
+            TTSResult: 合成结果
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(self.synthesize, text, output_path, voice, speed)
+        )
+
+    def synthesize_batch(
+        self,
+        items: List[Tuple[str, Path]],
+        voice: Optional[str] = None,
+        speed: Optional[float] = None
+    ) -> List[TTSResult]:
+        """
+        批量合成语音
+
+        默认在线程池中并发调用 synthesize()（最多 BATCH_CONCURRENCY 个），
+        各请求的连接建立和等待相互重叠。
+
+        Args:
+            items: (文本, 输出路径) 列表
+            voice: 语音 ID（可选，使用配置中的默认值）
+            speed: 语速（可选，使用配置中的默认值）
+
+        Returns:
+            与 items 一一对应的合成结果
+        """
+        if not items:
+            return []
+
+        workers = min(self.BATCH_CONCURRENCY, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.synthesize, text, output_path, voice, speed)
+                for text, output_path in items
+            ]
+            return [future.result() for future in futures]
+
     def get_voice(self, gender: str = "female") -> str:
         """
         获取指定性别的语音 ID（兼容旧接口）
@@ -24,20 +24,25 @@ TTS 管理器 - 通用入口，支持多 Provider
 
     # 为知识点生成所有音频
     audio_info = manager.generate_keypoint_audio(keypoint)
+
+    # 在异步上下文中并发生成
+    audio_info = await manager.agenerate_keypoint_audio(keypoint)
 """
 
+import asyncio
+import importlib
 from pathlib import Path
-from typing import Dict, Any, Optional, Type, ClassVar
+from typing import Dict, Any, Optional, Type, ClassVar, List, Tuple
 from datetime import date, datetime
 import os
+import shutil
 import sys
 
 # 添加 scripts 目录到路径以导入 state_manager
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from .base import TTSProvider, TTSConfig, TTSResult
-from .providers.xunfei import XunFeiProvider
-from .providers.edge import EdgeTTSProvider
+from ..utils import run_async
 
 try:
     from ...core.state_manager import get_default_state_dir
@@ -45,12 +50,42 @@ except ImportError:
     from scripts.core.state_manager import get_default_state_dir
 
 
-# Provider 注册表
-PROVIDERS: Dict[str, Type[TTSProvider]] = {
-    "edge-tts": EdgeTTSProvider,  # 默认推荐
-    "xunfei": XunFeiProvider,     # 备选方案
+# Provider 注册表：名称 -> (模块, 类名)，首次使用时才导入，
+# 避免只用 Edge-TTS 时也加载讯飞的 websocket 依赖（反之亦然）
+PROVIDERS: Dict[str, Tuple[str, str]] = {
+    "edge-tts": (".providers.edge", "EdgeTTSProvider"),   # 默认推荐
+    "xunfei": (".providers.xunfei", "XunFeiProvider"),    # 备选方案
 }
 
+# 已导入的 Provider 类
+_PROVIDER_CLASSES: Dict[str, Type[TTSProvider]] = {}
+
+
+def get_provider_class(provider: str) -> Type[TTSProvider]:
+    """
+    按名称获取 Provider 类（首次调用时导入对应模块）
+
+    Args:
+        provider: Provider 名称
+
+    Returns:
+        Provider 类
+
+    Raises:
+        ValueError: 未知的 Provider
+    """
+    provider_class = _PROVIDER_CLASSES.get(provider)
+    if provider_class is None:
+        if provider not in PROVIDERS:
+            raise ValueError(
+                f"Unknown provider: {provider}. "
+                f"Available: {list(PROVIDERS.keys())}"
+            )
+        module_name, class_name = PROVIDERS[provider]
+        module = importlib.import_module(module_name, __package__)
+        provider_class = _PROVIDER_CLASSES[provider] = getattr(module, class_name)
+    return provider_class
+
 
 class TTSManager:
     """
@@ -64,6 +99,7 @@ class TTSManager:
 
     # 支持的 Provider 列表
     SUPPORTED_PROVIDERS: ClassVar[list] = list(PROVIDERS.keys())
+    KEYPOINT_CONCURRENCY: ClassVar[int] = 8  # 知识点音频并发合成数
 
     def __init__(
         self,
@@ -93,11 +129,7 @@ class TTSManager:
                 api_secret="xxx"
             )
         """
-        if provider not in PROVIDERS:
-            raise ValueError(
-                f"Unknown provider: {provider}. "
-                f"Available: {list(PROVIDERS.keys())}"
-            )
+        provider_class = get_provider_class(provider)
 
         # 使用与 StateManager 相同的默认目录逻辑
         if data_dir is None:
@@ -112,11 +144,14 @@ class TTSManager:
         self.config = config or TTSConfig()
 
         # 初始化 Provider
-        self.provider: TTSProvider = PROVIDERS[provider](
+        self.provider: TTSProvider = provider_class(
             config=self.config,
             **credentials
         )
 
+        # 角色 -> 音色缓存，切换 Provider 时清空
+        self._voice_cache: Dict[str, str] = {}
+
     @classmethod
     def from_env(cls, provider: Optional[str] = None, **kwargs) -> "TTSManager":
         """
@@ -146,17 +181,45 @@ class TTSManager:
             provider: Provider 名称
             **credentials: 新 Provider 的认证信息
         """
-        if provider not in PROVIDERS:
-            raise ValueError(
-                f"Unknown provider: {provider}. "
-                f"Available: {list(PROVIDERS.keys())}"
-            )
+        provider_class = get_provider_class(provider)
 
         self.provider_name = provider
-        self.provider = PROVIDERS[provider](
+        self.provider = provider_class(
             config=self.config,
             **credentials
         )
+        self._voice_cache.clear()
+
+    def get_voice_by_role(self, role: str) -> str:
+        """
+        获取当前 Provider 指定角色的语音 ID（结果缓存）
+
+        Args:
+            role: 角色 ("narrator", "dialogue_a", "dialogue_b")
+
+        Returns:
+            语音 ID
+        """
+        voice = self._voice_cache.get(role)
+        if voice is None:
+            voice = self.provider.get_voice_by_role(role)
+            self._voice_cache[role] = voice
+        return voice
+
+    @property
+    def output_sample_rate(self) -> int:
+        """当前 Provider 输出音频的采样率（Hz）"""
+        return self.provider.OUTPUT_SAMPLE_RATE
+
+    @property
+    def supports_ssml(self) -> bool:
+        """当前 Provider 是否接受 SSML 文本"""
+        return self.provider.SUPPORTS_SSML
+
+    @property
+    def supports_wav_output(self) -> bool:
+        """当前 Provider 能否直接输出 PCM WAV"""
+        return self.provider.SUPPORTS_WAV_OUTPUT
 
     def synthesize(
         self,
@@ -179,10 +242,48 @@ class TTSManager:
         """
         return self.provider.synthesize(text, output_path, voice, speed)
 
+    async def asynthesize(
+        self,
+        text: str,
+        output_path: Path,
+        voice: Optional[str] = None,
+        speed: Optional[float] = None
+    ) -> TTSResult:
+        """
+        异步合成单条语音
+
+        Args:
+            text: 要合成的文本
+            output_path: 输出文件路径
+            voice: 语音 ID（可选）
+            speed: 语速（可选，0.5-2.0）
+
+        Returns:
+            TTSResult: 合成结果
+        """
+        return await self.provider.asynthesize(text, output_path, voice, speed)
+
     def generate_keypoint_audio(
         self,
         keypoint: Dict[str, Any],
         target_date: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """
+        为知识点生成所有音频（同步入口，内部并发合成）
+
+        Args:
+            keypoint: 知识点数据
+            target_date: 目标日期（可选，默认今天）
+
+        Returns:
+            音频信息字典，包含 dialogue 和 expressions 列表
+        """
+        return run_async(self.agenerate_keypoint_audio(keypoint, target_date))
+
+    async def agenerate_keypoint_audio(
+        self,
+        keypoint: Dict[str, Any],
+        target_date: Optional[date] = None
     ) -> Dict[str, Any]:
         """
         为知识点生成所有音频
@@ -191,6 +292,11 @@ class TTSManager:
         - 对话音频（按角色分文件，A=女声，B=男声）
         - 表达音频（语速更慢，适合学习）
 
+        各条音频并发合成（最多 KEYPOINT_CONCURRENCY 条同时进行，且不超过
+        provider 的 BATCH_CONCURRENCY 限制），
+        总耗时接近单条最慢的请求，结果顺序与原始内容一致。
+        音色、语速和文本都相同的条目只合成一次，其余复制该文件。
+
         Args:
             keypoint: 知识点数据
             target_date: 目标日期（可选，默认今天）
@@ -204,14 +310,10 @@ class TTSManager:
         date_audio_dir = self.audio_dir / date_str
         date_audio_dir.mkdir(parents=True, exist_ok=True)
 
-        audio_info = {
-            "dialogue": [],
-            "expressions": [],
-            "generated_at": datetime.now().isoformat(),
-            "provider": self.provider_name
-        }
+        # (分类, 基础条目, 合成参数)
+        jobs: List[Tuple[str, Dict[str, Any], Dict[str, Any]]] = []
 
-        # 1. 生成对话音频
+        # 1. 对话音频
         for i, example in enumerate(keypoint.get("examples", [])):
             for j, line in enumerate(example.get("dialogue", [])):
                 if ":" in line:
@@ -224,55 +326,102 @@ class TTSManager:
 
                     # A = 男声，B = 女声
                     gender = "male" if speaker.upper() == "A" else "female"
-                    voice = self.provider.get_voice(gender)
-                    output_path = date_audio_dir / f"dialogue_{i}_{j}_{speaker}.mp3"
-
-                    result = self.synthesize(
-                        text=text,
-                        output_path=output_path,
-                        voice=voice
-                    )
-
-                    if result.success:
-                        audio_info["dialogue"].append({
-                            "speaker": speaker,
-                            "text": text,
-                            "audio_url": f"audio/{date_str}/{output_path.name}"
-                        })
-                    else:
-                        # 记录错误但不中断
-                        audio_info["dialogue"].append({
-                            "speaker": speaker,
-                            "text": text,
-                            "error": result.error_message
-                        })
-
-        # 2. 生成表达音频（语速更慢）
+                    jobs.append(("dialogue", {"speaker": speaker, "text": text}, {
+                        "text": text,
+                        "output_path": date_audio_dir / f"dialogue_{i}_{j}_{speaker}.mp3",
+                        "voice": self.provider.get_voice(gender),
+                    }))
+
+        # 2. 表达音频（语速更慢）
         for i, expr in enumerate(keypoint.get("expressions", [])):
             phrase = expr.get("phrase", "")
             if not phrase:
                 continue
 
-            output_path = date_audio_dir / f"expression_{i+1}.mp3"
-            result = self.synthesize(
-                text=phrase,
-                output_path=output_path,
-                speed=0.7  # 更慢语速，适合学习
-            )
+            jobs.append(("expressions", {"text": phrase}, {
+                "text": phrase,
+                "output_path": date_audio_dir / f"expression_{i+1}.mp3",
+                "speed": 0.7,  # 更慢语速，适合学习
+            }))
+
+        semaphore = asyncio.Semaphore(
+            min(self.KEYPOINT_CONCURRENCY, self.provider.BATCH_CONCURRENCY)
+        )
+
+        # (音色, 语速, 文本) -> (合成任务, 输出路径)
+        inflight: Dict[Tuple[Optional[str], Optional[float], str], Tuple[asyncio.Future, Path]] = {}
 
+        async def _synthesize(params: Dict[str, Any]) -> TTSResult:
+            async with semaphore:
+                # provider 原地写入输出路径；先删除旧文件，避免写进旧版本留下的
+                # 硬链接（多个输出共享同一 inode）而互相覆盖
+                params["output_path"].unlink(missing_ok=True)
+                return await self.asynthesize(**params)
+
+        async def _reuse(shared: asyncio.Future, source: Path, output_path: Path) -> TTSResult:
+            result = await shared
             if result.success:
-                audio_info["expressions"].append({
-                    "text": phrase,
-                    "audio_url": f"audio/{date_str}/{output_path.name}"
-                })
+                self._copy_audio(source, output_path)
+                result = TTSResult(
+                    success=True,
+                    audio_path=output_path,
+                    duration_seconds=result.duration_seconds
+                )
+            return result
+
+        tasks = []
+        for _, _, params in jobs:
+            key = (params.get("voice"), params.get("speed"), params["text"])
+            if key in inflight:
+                shared, source = inflight[key]
+                tasks.append(_reuse(shared, source, params["output_path"]))
             else:
-                audio_info["expressions"].append({
-                    "text": phrase,
-                    "error": result.error_message
-                })
+                shared = asyncio.ensure_future(_synthesize(params))
+                inflight[key] = (shared, params["output_path"])
+                tasks.append(shared)
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        inflight.clear()
+
+        audio_info = {
+            "dialogue": [],
+            "expressions": [],
+            "generated_at": datetime.now().isoformat(),
+            "provider": self.provider_name
+        }
+
+        for (section, entry, params), result in zip(jobs, results):
+            if isinstance(result, BaseException):
+                # 记录错误但不中断
+                entry["error"] = str(result)
+            elif result.success:
+                entry["audio_url"] = f"audio/{date_str}/{params['output_path'].name}"
+            else:
+                entry["error"] = result.error_message
+            audio_info[section].append(entry)
 
         return audio_info
 
+    @staticmethod
+    def _copy_audio(source: Path, target: Path) -> None:
+        """
+        将已合成的音频复制到另一路径
+
+        复制而非硬链接：各输出路径是独立文件，之后重新生成其中一条时
+        不会改写其他路径的内容。先写入同目录临时文件再原子替换，目标
+        已存在（包括旧的硬链接）时只替换该路径本身。
+
+        Args:
+            source: 已合成的音频文件
+            target: 目标路径
+        """
+        tmp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        try:
+            shutil.copyfile(source, tmp_path)
+            os.replace(tmp_path, target)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
     @classmethod
     def list_supported_providers(cls) -> list:
         """
@@ -3,10 +3,22 @@
 TTS Providers - TTS 服务提供者实现
 """
 
-from .xunfei import XunFeiProvider
-from .edge import EdgeTTSProvider
+import importlib
+
+# 类名 -> 模块，访问时才导入（各 provider 依赖不同的第三方库）
+_PROVIDER_MODULES = {
+    "XunFeiProvider": ".xunfei",
+    "EdgeTTSProvider": ".edge",
+}
 
 __all__ = [
     "XunFeiProvider",
     "EdgeTTSProvider",
 ]
+
+
+def __getattr__(name):
+    if name in _PROVIDER_MODULES:
+        module = importlib.import_module(_PROVIDER_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,11 +10,32 @@ Microsoft Edge TTS 服务：
 """
 
 import asyncio
-import edge_tts
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, ClassVar, Dict
+from typing import Optional, ClassVar, Dict, List, Tuple
 
 from ..base import TTSProvider, TTSConfig, TTSResult
+from ...utils import run_in_background_loop
+
+
+@lru_cache(maxsize=16)
+def _format_rate(speed: float) -> str:
+    """
+    将 speed (0.5-2.0) 转换为 edge-tts 的 rate 格式
+
+    speed=1.0 -> rate="+0%"
+    speed=0.7 -> rate="-30%" (更慢，适合学习)
+    speed=1.5 -> rate="+50%" (更快)
+
+    同一批合成的语速相同，结果按 speed 缓存。
+
+    Args:
+        speed: 语速
+
+    Returns:
+        rate 字符串
+    """
+    return f"{int((speed - 1.0) * 100):+d}%"
 
 
 class EdgeTTSProvider(TTSProvider):
@@ -39,6 +60,14 @@ class EdgeTTSProvider(TTSProvider):
     DEFAULT_NARRATOR_VOICE: ClassVar[str] = "en-US-JennyNeural"    # 旁白 - 女声
     DEFAULT_DIALOGUE_A_VOICE: ClassVar[str] = "en-US-EricNeural"   # 对话 A - 男声
     DEFAULT_DIALOGUE_B_VOICE: ClassVar[str] = "en-US-JennyNeural"  # 对话 B - 女声
+    # Edge-TTS 默认输出 audio-24khz-48kbitrate-mono-mp3
+    OUTPUT_SAMPLE_RATE: ClassVar[int] = 24000
+    # edge-tts 会转义输入文本并自行构造 SSML，不支持自定义标签
+    SUPPORTS_SSML: ClassVar[bool] = False
+    # 只输出 MP3
+    SUPPORTS_WAV_OUTPUT: ClassVar[bool] = False
+    # 批量合成在单个事件循环中并发，不占用线程
+    BATCH_CONCURRENCY: ClassVar[int] = 8
 
     SUPPORTED_VOICES: ClassVar[Dict[str, str]] = {
         "en-US-JennyNeural": "美式英语女声，友好亲切（推荐）",
@@ -83,29 +112,80 @@ class EdgeTTSProvider(TTSProvider):
         Returns:
             TTSResult: 合成结果
         """
-        voice = voice or self.get_voice("female")
-        speed_val = speed or self.config.speed
+        # 在同步上下文中运行异步代码（复用后台常驻事件循环）
+        return run_in_background_loop(self.asynthesize(text, output_path, voice, speed))
+
+    def synthesize_batch(
+        self,
+        items: List[Tuple[str, Path]],
+        voice: Optional[str] = None,
+        speed: Optional[float] = None
+    ) -> List[TTSResult]:
+        """
+        批量合成语音（在同一事件循环中并发请求）
+
+        Args:
+            items: (文本, 输出路径) 列表
+            voice: 语音 ID（可选，默认使用女声）
+            speed: 语速（可选，0.5-2.0，1.0 = 正常）
+
+        Returns:
+            与 items 一一对应的合成结果
+        """
+        async def _synthesize_all() -> List[TTSResult]:
+            semaphore = asyncio.Semaphore(self.BATCH_CONCURRENCY)
+
+            async def _synthesize(text: str, output_path: Path) -> TTSResult:
+                async with semaphore:
+                    return await self.asynthesize(text, output_path, voice, speed)
 
-        # 将 speed (0.5-2.0) 转换为 edge-tts 的 rate 格式
-        # speed=1.0 -> rate="+0%"
-        # speed=0.7 -> rate="-30%" (更慢，适合学习)
-        # speed=1.5 -> rate="+50%" (更快)
-        rate_percent = int((speed_val - 1.0) * 100)
-        rate = f"{rate_percent:+d}%"
+            return await asyncio.gather(*(_synthesize(text, path) for text, path in items))
+
+        return run_in_background_loop(_synthesize_all())
+
+    async def asynthesize(
+        self,
+        text: str,
+        output_path: Path,
+        voice: Optional[str] = None,
+        speed: Optional[float] = None
+    ) -> TTSResult:
+        """
+        异步合成语音（edge-tts 原生协程，无需占用线程）
+
+        Args:
+            text: 要合成的文本
+            output_path: 输出文件路径（.mp3）
+            voice: 语音 ID（可选，默认使用女声）
+            speed: 语速（可选，0.5-2.0，1.0 = 正常）
+
+        Returns:
+            TTSResult: 合成结果
+        """
+        voice = voice or self.get_voice("female")
+        rate = _format_rate(speed or self.config.speed)
 
         # 确保输出目录存在
-        output_path = Path(output_path)
+        if not isinstance(output_path, Path):
+            output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        async def _synthesize_async():
-            """异步合成语音"""
-            communicate = edge_tts.Communicate(text, voice, rate=rate)
-            await communicate.save(str(output_path))
+        # 首次合成时才导入 edge-tts（不合成语音的命令无需加载）
+        import edge_tts
 
         try:
-            # 在同步上下文中运行异步代码
-            asyncio.run(_synthesize_async())
+            communicate = edge_tts.Communicate(text, voice, rate=rate)
+            # 音频块到达即写入文件（每块仅数 KB，缓冲写入不会阻塞事件循环）
+            with open(output_path, "wb") as f:
+                async for chunk in communicate.stream():
+                    if chunk["type"] == "audio":
+                        f.write(chunk["data"])
             return TTSResult(success=True, audio_path=output_path)
 
         except Exception as e:
+            # 不保留写了一半的文件，避免被按文件存在与否判断的缓存误用
+            try:
+                output_path.unlink()
+            except OSError:
+                pass
             return TTSResult(success=False, error_message=str(e))
@@ -9,17 +9,16 @@
 - WebSocket 流式接口
 """
 
-import websocket
 import datetime
 import hashlib
 import base64
+import binascii
 import hmac
 import json
 import os
-import ssl
-import certifi
+import wave
 from pathlib import Path
-from typing import Optional, ClassVar, Dict
+from typing import Optional, ClassVar, Dict, List, Any
 from urllib.parse import urlencode
 
 from ..base import TTSProvider, TTSConfig, TTSResult
@@ -48,6 +47,23 @@ class XunFeiProvider(TTSProvider):
     DEFAULT_NARRATOR_VOICE: ClassVar[str] = "catherine"  # 旁白 - 女声
     DEFAULT_DIALOGUE_A_VOICE: ClassVar[str] = "henry"    # 对话 A - 男声
     DEFAULT_DIALOGUE_B_VOICE: ClassVar[str] = "catherine"  # 对话 B - 女声
+    # 请求参数 auf=audio/L16;rate=16000
+    OUTPUT_SAMPLE_RATE: ClassVar[int] = 16000
+    # 讯飞使用自有的 [p500] 停顿标记，不支持 SSML
+    SUPPORTS_SSML: ClassVar[bool] = False
+    # aue=raw 返回 16-bit PCM，加上 WAV 文件头即可，省去服务端 MP3 编码和本地解码
+    SUPPORTS_WAV_OUTPUT: ClassVar[bool] = True
+    # 每次合成占用一个 WebSocket 连接（服务端在 status=2 后关闭），
+    # 批量合成时并发建立连接以重叠握手耗时；免费额度的并发路数有限
+    BATCH_CONCURRENCY: ClassVar[int] = 2
+
+    # 每次请求相同的 business 参数（aue / vcn / speed 按请求填入）
+    BUSINESS_DEFAULTS: ClassVar[Dict[str, Any]] = {
+        "sfl": 1,                       # 开启流式返回
+        "auf": "audio/L16;rate=16000",
+        "volume": 50,                   # 音量
+        "pitch": 50,                    # 音调
+    }
 
     SUPPORTED_VOICES: ClassVar[Dict[str, str]] = {
         "catherine": "美式英语女声，自然流畅（推荐）",
@@ -78,6 +94,13 @@ class XunFeiProvider(TTSProvider):
                         f"Set XUNFEI_{key.upper()} environment variable or pass it to constructor."
                     )
 
+        # 预先完成密钥处理（ipad/opad），每次签名只需 copy() 后 update()
+        self._hmac_template = hmac.new(
+            self.credentials["api_secret"].encode('utf-8'),
+            digestmod=hashlib.sha256
+        )
+        self._common = {"app_id": self.credentials["appid"]}
+
     def _create_auth_url(self) -> str:
         """
         生成 WebSocket 鉴权 URL
@@ -87,11 +110,9 @@ class XunFeiProvider(TTSProvider):
         """
         date = datetime.datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT')
         signature_origin = f"host: tts-api.xfyun.cn\ndate: {date}\nGET /v2/tts HTTP/1.1"
-        signature_sha = hmac.new(
-            self.credentials["api_secret"].encode('utf-8'),
-            signature_origin.encode('utf-8'),
-            digestmod=hashlib.sha256
-        ).digest()
+        mac = self._hmac_template.copy()
+        mac.update(signature_origin.encode('utf-8'))
+        signature_sha = mac.digest()
         signature = base64.b64encode(signature_sha).decode()
         authorization = base64.b64encode(
             f'api_key="{self.credentials["api_key"]}", algorithm="hmac-sha256", '
@@ -117,19 +138,22 @@ class XunFeiProvider(TTSProvider):
 
         Args:
             text: 要合成的文本
-            output_path: 输出文件路径（.mp3）
+            output_path: 输出文件路径（.mp3；.wav 时输出单声道 16-bit PCM WAV）
             voice: 语音 ID（可选，默认使用女声）
             speed: 语速（可选，0.5-2.0，1.0 = 正常）
 
         Returns:
             TTSResult: 合成结果
         """
+        output_path = Path(output_path)
+        raw_pcm = output_path.suffix.lower() == ".wav"
         voice = voice or self.get_voice("female")
         # 讯飞语速范围 0-100，50 为正常
         speed_val = speed or self.config.speed
         speed_int = int(speed_val * 50)
 
-        audio_data = bytearray()
+        # 各帧解码后的音频，结束时一次写出（避免 bytearray 反复扩容）
+        audio_chunks: List[bytes] = []
         error_msg = None
 
         def on_message(ws, message):
@@ -137,10 +161,12 @@ class XunFeiProvider(TTSProvider):
             try:
                 data = json.loads(message)
                 if data.get("code") == 0:
-                    audio = data.get("data", {}).get("audio", "")
-                    status = data.get("data", {}).get("status", 0)
+                    payload = data.get("data", {})
+                    audio = payload.get("audio", "")
+                    status = payload.get("status", 0)
                     if audio:
-                        audio_data.extend(base64.b64decode(audio))
+                        # 直接调用 C 实现的解码，跳过 b64decode 的参数校验包装
+                        audio_chunks.append(binascii.a2b_base64(audio))
                     # status=2 表示合成完成，关闭连接
                     if status == 2:
                         ws.close()
@@ -153,24 +179,28 @@ class XunFeiProvider(TTSProvider):
             nonlocal error_msg
             error_msg = str(error)
 
-        def on_open(ws):
-            request = {
-                "common": {"app_id": self.credentials["appid"]},
-                "business": {
-                    "aue": "lame",      # MP3 格式
-                    "sfl": 1,           # 开启流式返回
-                    "auf": "audio/L16;rate=16000",
-                    "vcn": voice,       # 发音人
-                    "speed": speed_int, # 语速
-                    "volume": 50,       # 音量
-                    "pitch": 50,        # 音调
-                },
-                "data": {
-                    "status": 2,  # 一次性传输
-                    "text": str(base64.b64encode(text.encode('utf-8')), "UTF8")
-                }
+        # 请求在连接前序列化好，on_open 中直接发送
+        request = json.dumps({
+            "common": self._common,
+            "business": {
+                **self.BUSINESS_DEFAULTS,
+                "aue": "raw" if raw_pcm else "lame",  # PCM 或 MP3 格式
+                "vcn": voice,                         # 发音人
+                "speed": speed_int,                   # 语速
+            },
+            "data": {
+                "status": 2,  # 一次性传输
+                "text": binascii.b2a_base64(text.encode('utf-8'), newline=False).decode('ascii')
             }
-            ws.send(json.dumps(request))
+        })
+
+        def on_open(ws):
+            ws.send(request)
+
+        # 首次合成时才导入 WebSocket / 证书依赖（不合成语音的命令无需加载）
+        import ssl
+        import certifi
+        import websocket
 
         try:
             ws_url = self._create_auth_url()
@@ -188,16 +218,29 @@ class XunFeiProvider(TTSProvider):
             if error_msg:
                 return TTSResult(success=False, error_message=error_msg)
 
-            if not audio_data:
+            if not audio_chunks:
                 return TTSResult(success=False, error_message="No audio data received")
 
             # 确保输出目录存在
-            output_path = Path(output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
             # 保存音频文件
+            if raw_pcm:
+                with wave.open(str(output_path), "wb") as wav:
+                    wav.setnchannels(1)
+                    wav.setsampwidth(2)
+                    wav.setframerate(self.OUTPUT_SAMPLE_RATE)
+                    for chunk in audio_chunks:
+                        wav.writeframesraw(chunk)
+                frames = sum(len(chunk) for chunk in audio_chunks) // 2
+                return TTSResult(
+                    success=True,
+                    audio_path=output_path,
+                    duration_seconds=frames / self.OUTPUT_SAMPLE_RATE
+                )
+
             with open(output_path, "wb") as f:
-                f.write(audio_data)
+                f.writelines(audio_chunks)
 
             return TTSResult(success=True, audio_path=output_path)
 
@@ -5,16 +5,181 @@
 提供音频处理相关的通用功能，避免代码重复。
 """
 
+import asyncio
+import atexit
 import re
 import shutil
 import subprocess
+import threading
+import wave
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, List, Awaitable, TypeVar
 
+try:
+    from mutagen import File as MutagenFile
+except ImportError:  # mutagen 为可选依赖，缺失时通过 ffmpeg 读取时长
+    MutagenFile = None
 
+try:
+    import uvloop
+except ImportError:  # uvloop 为可选依赖，缺失时使用 asyncio 默认事件循环
+    uvloop = None
+
+T = TypeVar("T")
+
+
+# ffmpeg 只输出错误信息：省去版本横幅和进度刷新，stderr 从数十 KB 降到几乎为空
+FFMPEG_QUIET_ARGS: List[str] = ["-hide_banner", "-nostats", "-loglevel", "error"]
+
+# ffmpeg 输入信息中的时长行（按字节匹配，无需解码 stderr）
+_DURATION_RE = re.compile(rb"Duration: (\d+):(\d+):(\d+\.?\d*)")
+
+
+def decode_stderr(stderr: bytes) -> str:
+    """
+    解码子进程 stderr（仅在出错时调用，成功时不必解码）
+
+    Args:
+        stderr: 原始字节输出
+
+    Returns:
+        解码后的文本（非法字节替换为占位符）
+    """
+    return stderr.decode("utf-8", errors="replace").strip()
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    创建新的事件循环（已安装 uvloop 时使用 uvloop）
+
+    只影响本模块创建的事件循环，不修改进程全局的事件循环策略。
+
+    Returns:
+        新的事件循环
+    """
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def _cancel_all_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    """取消事件循环中剩余的任务并等待其结束（与 asyncio.run 的收尾一致）"""
+    pending = asyncio.all_tasks(loop)
+    if not pending:
+        return
+    for task in pending:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
+
+def run_async(coro: Awaitable[T]) -> T:
+    """
+    在新的事件循环中运行协程（同步入口使用）
+
+    已安装 uvloop 时使用 uvloop 事件循环，aiohttp / edge-tts 等网络 I/O
+    吞吐更高；未安装时与 asyncio.run 相同。
+
+    Args:
+        coro: 要运行的协程
+
+    Returns:
+        协程的返回值
+    """
+    if uvloop is None:
+        return asyncio.run(coro)
+
+    if hasattr(asyncio, "Runner"):  # Python 3.11+
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+
+    loop = uvloop.new_event_loop()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(coro)
+    finally:
+        try:
+            _cancel_all_tasks(loop)
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+
+# 后台常驻事件循环及其线程（见 run_in_background_loop），首次使用时启动
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_thread: Optional[threading.Thread] = None
+_background_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    获取后台常驻事件循环（首次调用时在守护线程中启动）
+
+    Returns:
+        后台事件循环
+    """
+    global _background_loop, _background_thread
+    with _background_lock:
+        if _background_loop is None:
+            loop = _new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="audio-event-loop", daemon=True
+            )
+            thread.start()
+            atexit.register(_stop_background_loop, loop, thread)
+            _background_loop, _background_thread = loop, thread
+        return _background_loop
+
+
+def _stop_background_loop(loop: asyncio.AbstractEventLoop, thread: threading.Thread) -> None:
+    """解释器退出时取消剩余任务、停止并关闭后台事件循环"""
+    async def _shutdown() -> None:
+        current = asyncio.current_task()
+        pending = [task for task in asyncio.all_tasks() if task is not current]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        await loop.shutdown_asyncgens()
+
+    try:
+        asyncio.run_coroutine_threadsafe(_shutdown(), loop).result(timeout=5)
+    except Exception:
+        pass
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+    if not thread.is_alive():
+        loop.close()
+
+
+def run_in_background_loop(coro: Awaitable[T]) -> T:
+    """
+    在后台常驻事件循环中运行协程，并阻塞等待结果
+
+    供需要反复在同步代码中运行协程的场景使用，避免 asyncio.run 每次
+    新建和销毁事件循环；所有线程共享同一个事件循环线程，可在线程池中
+    并发调用，不会为每个工作线程各留下一个未关闭的事件循环。
+
+    Args:
+        coro: 要运行的协程
+
+    Returns:
+        协程的返回值
+
+    Raises:
+        RuntimeError: 在后台事件循环线程内调用（会导致死锁）
+    """
+    loop = _get_background_loop()
+    if threading.current_thread() is _background_thread:
+        coro.close()
+        raise RuntimeError("run_in_background_loop() cannot be called from the background loop")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+@lru_cache(maxsize=1)
 def get_ffmpeg_path() -> str:
     """
-    获取 FFmpeg 可执行文件路径
+    获取 FFmpeg 可执行文件路径（结果缓存，进程内只查找一次 PATH）
 
     Returns:
         FFmpeg 路径
@@ -31,10 +196,28 @@ def get_ffmpeg_path() -> str:
     return ffmpeg_path
 
 
+def get_wav_duration(audio_path: Path) -> float:
+    """
+    从 WAV 文件头读取时长（不启动子进程）
+
+    Args:
+        audio_path: WAV 文件路径
+
+    Returns:
+        时长（秒）
+    """
+    with wave.open(str(audio_path), "rb") as wav:
+        return wav.getnframes() / wav.getframerate()
+
+
 def get_audio_duration(audio_path: Path, ffmpeg_path: Optional[str] = None) -> float:
     """
     获取音频文件时长
 
+    WAV 文件直接读取文件头；已安装 mutagen 时由其解析 MP3/Opus 等容器头；
+    其他情况只让 ffmpeg 读取输入信息（不指定输出，不做完整解码），
+    从 stderr 字节中解析 Duration 行。
+
     Args:
         audio_path: 音频文件路径
         ffmpeg_path: FFmpeg 可执行文件路径（可选，默认自动检测）
@@ -42,21 +225,38 @@ def get_audio_duration(audio_path: Path, ffmpeg_path: Optional[str] = None) -> f
     Returns:
         时长（秒），如果无法解析则返回 0.0
     """
+    if str(audio_path).lower().endswith(".wav"):
+        try:
+            return get_wav_duration(audio_path)
+        except (wave.Error, EOFError, OSError):
+            pass
+
+    if MutagenFile is not None:
+        try:
+            info = MutagenFile(str(audio_path))
+            if info is not None and info.info.length:
+                return float(info.info.length)
+        except Exception:
+            # 无法识别或损坏的文件交给 ffmpeg 处理
+            pass
+
     if ffmpeg_path is None:
         ffmpeg_path = get_ffmpeg_path()
 
+    # 没有输出文件时 ffmpeg 打印输入信息后以非零状态退出，这正是所需的全部输出
     cmd = [
         ffmpeg_path,
-        "-i", str(audio_path),
         "-hide_banner",
-        "-f", "null",
-        "-"
+        "-i", str(audio_path),
     ]
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    try:
+        result = subprocess.run(cmd, capture_output=True, timeout=30)
+    except subprocess.TimeoutExpired:
+        return 0.0
 
     # 从 stderr 中解析时长，格式: "  Duration: 00:00:03.45, ..."
-    match = re.search(r"Duration: (\d+):(\d+):(\d+\.?\d*)", result.stderr)
+    match = _DURATION_RE.search(result.stderr)
     if match:
         hours, minutes, seconds = match.groups()
         return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
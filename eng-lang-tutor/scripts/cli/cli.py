@@ -7,6 +7,7 @@ This module provides command-line access to state management operations.
 
 import argparse
 import json
+import sys
 from datetime import datetime
 from typing import Optional
 
@@ -15,9 +16,62 @@ try:
 except ImportError:
     from scripts.core.state_manager import StateManager
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# Accepted values for `config --cefr` / `config --style`
+CEFR_LEVELS = frozenset({'A1', 'A2', 'B1', 'B2', 'C1', 'C2'})
+TUTOR_STYLES = frozenset({'humorous', 'rigorous', 'casual', 'professional'})
+
+
+def _dump(obj) -> str:
+    """Format an object as indented JSON for terminal output."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _show_state(sm: StateManager) -> None:
+    """Print the full state as JSON."""
+    state = sm.load_state()
+    print(_dump(state))
+
+
+def _backup_state(sm: StateManager) -> None:
+    """Create a state backup and print its path."""
+    backup_path = sm.backup_state()
+    print(f"Backup created: {backup_path}")
+
+
+def _show_stats(sm: StateManager) -> None:
+    """Display learning progress summary."""
+    try:
+        from ..core.gamification import GamificationManager
+    except ImportError:
+        from scripts.core.gamification import GamificationManager
+    state = sm.load_state()
+    gm = GamificationManager()
+    summary = gm.get_progress_summary(state)
+    print(_dump(summary))
+
+
+# Commands that take no options; a bare invocation skips building the parser
+FAST_COMMANDS = {
+    'show': _show_state,
+    'backup': _backup_state,
+    'stats': _show_stats,
+}
+
 
 def main():
     """Main CLI entry point."""
+    argv = sys.argv[1:]
+    if not argv or (len(argv) == 1 and argv[0] in FAST_COMMANDS):
+        FAST_COMMANDS[argv[0] if argv else 'show'](StateManager(None))
+        return
+
     parser = argparse.ArgumentParser(description="State Manager for eng-lang-tutor")
     parser.add_argument('--data-dir', default=None,
                         help='Data directory path (default: ~/.openclaw/state/eng-lang-tutor or OPENCLAW_STATE_DIR env)')
@@ -49,12 +103,10 @@ def main():
     sm = StateManager(args.data_dir)
 
     if args.command == 'show' or not args.command:
-        state = sm.load_state()
-        print(json.dumps(state, indent=2, ensure_ascii=False))
+        _show_state(sm)
 
     elif args.command == 'backup':
-        backup_path = sm.backup_state()
-        print(f"Backup created: {backup_path}")
+        _backup_state(sm)
 
     elif args.command == 'save_daily':
         if not args.content_type or not args.content:
@@ -93,15 +145,7 @@ def main():
         print("View recorded successfully")
 
     elif args.command == 'stats':
-        """Display learning progress summary."""
-        try:
-            from ..core.gamification import GamificationManager
-        except ImportError:
-            from scripts.core.gamification import GamificationManager
-        state = sm.load_state()
-        gm = GamificationManager()
-        summary = gm.get_progress_summary(state)
-        print(json.dumps(summary, indent=2, ensure_ascii=False))
+        _show_stats(sm)
 
     elif args.command == 'config':
         """Display or update user configuration."""
@@ -116,18 +160,18 @@ def main():
                 "topic_weights": state.get("preferences", {}).get("topic_weights", {}),
                 "schedule": state.get("schedule", {})
             }
-            print(json.dumps(config, indent=2, ensure_ascii=False))
+            print(_dump(config))
         else:
             # Update configuration
             if args.cefr:
-                if args.cefr not in ['A1', 'A2', 'B1', 'B2', 'C1', 'C2']:
+                if args.cefr not in CEFR_LEVELS:
                     print("Error: Invalid CEFR level. Must be A1, A2, B1, B2, C1, or C2")
                     exit(1)
                 state = sm.update_preferences(state, cefr_level=args.cefr)
                 print(f"Updated CEFR level to: {args.cefr}")
 
             if args.style:
-                if args.style not in ['humorous', 'rigorous', 'casual', 'professional']:
+                if args.style not in TUTOR_STYLES:
                     print("Error: Invalid style. Must be humorous, rigorous, casual, or professional")
                     exit(1)
                 state = sm.update_preferences(state, tutor_style=args.style)
@@ -150,7 +194,7 @@ def main():
         if args.stats:
             # Get error statistics
             stats = sm.get_error_stats(state)
-            print(json.dumps(stats, indent=2, ensure_ascii=False))
+            print(_dump(stats))
 
         elif args.review is not None:
             # Get errors for review session
@@ -159,7 +203,7 @@ def main():
                 "count": len(errors),
                 "errors": errors
             }
-            print(json.dumps(result, indent=2, ensure_ascii=False))
+            print(_dump(result))
 
         else:
             # Get paginated errors list
@@ -170,7 +214,7 @@ def main():
                 month=args.month,
                 random=args.random
             )
-            print(json.dumps(result, indent=2, ensure_ascii=False))
+            print(_dump(result))
 
     elif args.command == 'schedule':
         """Display or update schedule configuration."""
@@ -179,7 +223,7 @@ def main():
         # If no update options, just show current schedule
         if not any([args.keypoint_time, args.quiz_time]):
             schedule = state.get("schedule", {})
-            print(json.dumps(schedule, indent=2, ensure_ascii=False))
+            print(_dump(schedule))
         else:
             # Validate quiz_time must be later than keypoint_time
             current_keypoint = state.get("schedule", {}).get("keypoint_time", "06:45")
@@ -10,13 +10,203 @@ Handles:
 """
 
 import re
+from functools import lru_cache
 from typing import Dict, Any, Optional, Tuple
 from datetime import datetime, date, timedelta
 
+# Parameter extraction patterns, compiled once at import
+DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+CEFR_RE = re.compile(r"(A1|A2|B1|B2|C1|C2)", re.I)
+RATIO_RE = re.compile(r"(\d{1,3})\s*(%|percent|百分比)?")
+PAGE_RE = re.compile(r"(第\s*)?(\d+)(\s*页|page)", re.I)
+MONTH_RE = re.compile(r"(\d{4}-\d{2})(?!-\d{2})")
+RANDOM_RE = re.compile(r"(随机|random)\s*(\d*)", re.I)
+REVIEW_COUNT_RE = re.compile(r"(复习|review|练习|practice)\s*(\d*)", re.I)
+
+# Every command pattern requires one of these literals (its leading keyword
+# group), so a message containing none of them cannot match any command.
+# Keep in sync with CommandParser.COMMAND_PATTERNS.
+_TRIGGER_TOKENS = frozenset([
+    "start", "begin", "开始", "初始化", "你好", "hello", "hi", "嗨", "hey",
+    "keypoint", "知识点", "今天", "today",
+    "quiz", "测验", "test", "测试", "答题", "考试",
+    "stats", "progress", "进度", "统计", "等级", "level", "xp", "连胜", "streak",
+    "成就", "achievement",
+    "config", "setting", "设置", "配置", "偏好", "preference",
+    "cefr", "style", "风格", "导师",
+    "topic", "主题", "配比", "权重", "兴趣",
+    "ratio", "比例",
+    "schedule", "时间表", "推送时间", "定时",
+    "error", "mistake", "wrong", "错误", "错题",
+    "help", "帮助", "usage", "怎么用", "how to use", "command", "命令", "指令", "功能",
+])
+
+
+# Onboarding keyword tables (keywords are lowercase)
+TOPIC_KEYWORDS = {
+    "movies": ["movie", "film", "影视", "电影", "美剧"],
+    "news": ["news", "新闻"],
+    "gaming": ["game", "gaming", "游戏"],
+    "sports": ["sport", "sports", "体育", "运动"],
+    "workplace": ["work", "workplace", "office", "职场", "工作"],
+    "social": ["social", "社交"],
+    "daily_life": ["daily", "life", "生活", "日常"]
+}
+
+STYLE_KEYWORDS = {
+    "humorous": ["humorous", "幽默"],
+    "rigorous": ["rigorous", "严谨"],
+    "casual": ["casual", "随意", "轻松"],
+    "professional": ["professional", "专业"]
+}
+
+
+def _build_keyword_matcher(table: Dict[str, list]) -> Tuple[re.Pattern, Dict[str, str]]:
+    """
+    Build a single-pass matcher for a {name: [keywords]} table.
+
+    The alternation sits inside a lookahead, so finditer() reports a keyword
+    at every position, overlapping ones included - the same hits as testing
+    each keyword with `in`, from one scan of the message.
+
+    Returns:
+        (compiled regex, keyword -> name mapping)
+    """
+    owner = {kw: name for name, keywords in table.items() for kw in keywords}
+    alternation = "|".join(re.escape(kw) for kw in sorted(owner, key=len, reverse=True))
+    return re.compile(f"(?=({alternation}))"), owner
+
+
+_TOPIC_RE, _TOPIC_OF = _build_keyword_matcher(TOPIC_KEYWORDS)
+_STYLE_RE, _STYLE_OF = _build_keyword_matcher(STYLE_KEYWORDS)
+
+
+def _find_keyword_names(pattern: re.Pattern, owner: Dict[str, str], message_lower: str) -> set:
+    """Return the table names whose keywords occur in a lowercased message."""
+    return {owner[m.group(1)] for m in pattern.finditer(message_lower)}
+
+
+def _match_style(message_lower: str) -> Optional[str]:
+    """Return the tutor style mentioned in a lowercased message (first in table order wins)."""
+    found = _find_keyword_names(_STYLE_RE, _STYLE_OF, message_lower)
+    if found:
+        for style in STYLE_KEYWORDS:
+            if style in found:
+                return style
+    return None
+
+
+def _has_trigger(message_folded: str) -> bool:
+    """Check whether a casefolded message contains any command keyword."""
+    return any(token in message_folded for token in _TRIGGER_TOKENS)
+
+
+# =============================================================================
+# Parameter extractors
+# Each fills `params` from the message; _param_extractors_for() decides once
+# per command which of them apply.
+# =============================================================================
+
+def _extract_date(message: str, message_lower: str, params: Dict[str, Any]) -> None:
+    """Explicit YYYY-MM-DD date, else yesterday/day-before mentions, else today."""
+    date_match = DATE_RE.search(message)
+    if date_match:
+        params["date"] = date_match.group(1)
+    elif "昨天" in message or "yesterday" in message_lower:
+        params["date"] = (date.today() - timedelta(days=1)).isoformat()
+    elif "前天" in message:
+        params["date"] = (date.today() - timedelta(days=2)).isoformat()
+    else:
+        params["date"] = date.today().isoformat()
+
+
+def _extract_history_date(message: str, message_lower: str, params: Dict[str, Any]) -> None:
+    """Explicit YYYY-MM-DD date, else yesterday."""
+    date_match = DATE_RE.search(message)
+    if date_match:
+        params["date"] = date_match.group(1)
+    else:
+        params["date"] = (date.today() - timedelta(days=1)).isoformat()
+
+
+def _extract_cefr(message: str, message_lower: str, params: Dict[str, Any]) -> None:
+    """CEFR level (A1-C2)."""
+    level_match = CEFR_RE.search(message)
+    if level_match:
+        params["cefr_level"] = level_match.group(1).upper()
+
+
+def _extract_style(message: str, message_lower: str, params: Dict[str, Any]) -> None:
+    """Tutor style."""
+    style = _match_style(message_lower)
+    if style:
+        params["tutor_style"] = style
+
+
+def _extract_ratio(message: str, message_lower: str, params: Dict[str, Any]) -> None:
+    """Oral/written ratio given as a percentage."""
+    ratio_match = RATIO_RE.search(message)
+    if ratio_match:
+        params["oral_written_ratio"] = int(ratio_match.group(1)) / 100.0
+
+
+def _extract_error_paging(message: str, message_lower: str, params: Dict[str, Any]) -> None:
+    """Error notebook page number, month filter (YYYY-MM) and random count."""
+    page_match = PAGE_RE.search(message)
+    if page_match:
+        params["page"] = int(page_match.group(2))
+
+    month_match = MONTH_RE.search(message)
+    if month_match:
+        params["month"] = month_match.group(1)
+
+    random_match = RANDOM_RE.search(message)
+    if random_match:
+        params["random"] = int(random_match.group(2)) if random_match.group(2) else 5
+
+
+def _extract_more_page(message: str, message_lower: str, params: Dict[str, Any]) -> None:
+    """Default page for the "more" command."""
+    params["page"] = params.get("page", 2)
+
+
+def _extract_review_count(message: str, message_lower: str, params: Dict[str, Any]) -> None:
+    """Number of questions for an errors_review session (default 5)."""
+    count_match = REVIEW_COUNT_RE.search(message)
+    if count_match and count_match.group(2):
+        params["count"] = int(count_match.group(2))
+    else:
+        params["count"] = 5
+
+
+def _param_extractors_for(cmd_name: str) -> Tuple:
+    """Select, in application order, the parameter extractors for a command."""
+    extractors = []
+    if cmd_name == "keypoint_history":
+        extractors.append(_extract_history_date)
+    elif "date" in cmd_name or cmd_name == "keypoint_today":
+        extractors.append(_extract_date)
+    if "cefr" in cmd_name:
+        extractors.append(_extract_cefr)
+    if "style" in cmd_name:
+        extractors.append(_extract_style)
+    if "ratio" in cmd_name:
+        extractors.append(_extract_ratio)
+    if cmd_name.startswith("errors"):
+        extractors.append(_extract_error_paging)
+        if "more" in cmd_name:
+            extractors.append(_extract_more_page)
+        if "review" in cmd_name:
+            extractors.append(_extract_review_count)
+    return tuple(extractors)
+
 
 class CommandParser:
     """Parses user messages to determine intent and extract parameters."""
 
+    # Only per-instance state; all pattern tables are shared class attributes
+    __slots__ = ("state_manager",)
+
     # Command patterns with bilingual support
     COMMAND_PATTERNS = {
         # Initialization commands
@@ -66,6 +256,31 @@ class CommandParser:
         "ratio": r"(\d{1,3})\s*(%|percent|百分比)?",
     }
 
+    # Compiled once per class; parsing only calls .search() on these
+    _COMMAND_RES = {name: re.compile(p) for name, p in COMMAND_PATTERNS.items()}
+    _ONBOARDING_RES = {name: re.compile(p) for name, p in ONBOARDING_PATTERNS.items()}
+
+    # All command patterns merged into one regex, scanned in a single call.
+    # Each alternative is anchored at the start and skips ahead lazily, so
+    # earlier patterns still win whenever they match anywhere in the message
+    # (same priority as trying them one by one in dict order). Every command
+    # pattern carries (?i), which is applied once to the whole regex.
+    _COMBINED_COMMAND_RE = re.compile(
+        r"^(?:" + "|".join(
+            rf"(?P<{name}>[\s\S]*?(?:{p[len('(?i)'):]}))"
+            for name, p in COMMAND_PATTERNS.items()
+        ) + ")",
+        re.I
+    )
+
+    # Command -> parameter extractors to run, resolved once per command
+    _PARAM_EXTRACTORS = {name: _param_extractors_for(name) for name in COMMAND_PATTERNS}
+    # Commands whose params default to today's date (results change daily)
+    _DATE_DEPENDENT_COMMANDS = frozenset(
+        name for name, extractors in _PARAM_EXTRACTORS.items()
+        if _extract_date in extractors or _extract_history_date in extractors
+    )
+
     def __init__(self, state_manager=None):
         """
         Initialize the command parser.
@@ -103,7 +318,7 @@ class CommandParser:
 
         if step == 0:
             # Check for start command
-            if re.search(self.COMMAND_PATTERNS["init_start"], message):
+            if self._COMMAND_RES["init_start"].search(message):
                 return {
                     "command": "init_start",
                     "params": {},
@@ -134,27 +349,14 @@ class CommandParser:
         result = {"type": None, "value": None}
 
         if step == 1:  # CEFR level
-            match = re.search(self.ONBOARDING_PATTERNS["cefr_level"], message)
+            match = self._ONBOARDING_RES["cefr_level"].search(message)
             if match:
                 result = {"type": "cefr_level", "value": match.group(1).upper()}
 
         elif step == 2:  # Topics
-            topics = {}
-            topic_keywords = {
-                "movies": ["movie", "film", "影视", "电影", "美剧"],
-                "news": ["news", "新闻"],
-                "gaming": ["game", "gaming", "游戏"],
-                "sports": ["sport", "sports", "体育", "运动"],
-                "workplace": ["work", "workplace", "office", "职场", "工作"],
-                "social": ["social", "社交"],
-                "daily_life": ["daily", "life", "生活", "日常"]
-            }
-
-            for topic, keywords in topic_keywords.items():
-                for kw in keywords:
-                    if kw.lower() in message.lower():
-                        topics[topic] = 0.2  # Default weight
-                        break
+            found = _find_keyword_names(_TOPIC_RE, _TOPIC_OF, message.lower())
+            # Default weight per topic, in table order
+            topics = {topic: 0.2 for topic in TOPIC_KEYWORDS if topic in found}
 
             if topics:
                 # Normalize weights to sum to 1.0
@@ -163,22 +365,12 @@ class CommandParser:
                 result = {"type": "topics", "value": topics}
 
         elif step == 3:  # Tutor style
-            style_map = {
-                "humorous": ["humorous", "幽默"],
-                "rigorous": ["rigorous", "严谨"],
-                "casual": ["casual", "随意", "轻松"],
-                "professional": ["professional", "专业"]
-            }
-            for style, keywords in style_map.items():
-                for kw in keywords:
-                    if kw.lower() in message.lower():
-                        result = {"type": "tutor_style", "value": style}
-                        break
-                if result["value"]:
-                    break
+            style = _match_style(message.lower())
+            if style:
+                result = {"type": "tutor_style", "value": style}
 
         elif step == 4:  # Oral/written ratio
-            match = re.search(self.ONBOARDING_PATTERNS["ratio"], message)
+            match = self._ONBOARDING_RES["ratio"].search(message)
             if match:
                 ratio = int(match.group(1)) / 100.0
                 ratio = max(0, min(1, ratio))  # Clamp to 0-1
@@ -195,88 +387,26 @@ class CommandParser:
             "onboarding_input": None
         }
 
-        # Check each command pattern
-        for cmd_name, pattern in self.COMMAND_PATTERNS.items():
-            match = re.search(pattern, message)
-            if match:
-                result["command"] = cmd_name
-                result["params"] = self._extract_params(cmd_name, match, message)
-                result["requires_init"] = not cmd_name.startswith("init") and cmd_name != "help"
-                break
+        cmd_name, params = _parse_command_cached(message)
+        if cmd_name is not None:
+            result["command"] = cmd_name
+            # Date-dependent params are never cached; fresh dict for callers
+            if params is None:
+                result["params"] = self._extract_params(cmd_name, message)
+            else:
+                result["params"] = dict(params)
+            result["requires_init"] = not cmd_name.startswith("init") and cmd_name != "help"
 
         return result
 
-    def _extract_params(self, cmd_name: str, match: re.Match, message: str) -> Dict[str, Any]:
+    def _extract_params(self, cmd_name: str, message: str) -> Dict[str, Any]:
         """Extract parameters from matched command."""
         params = {}
-
-        # Extract date from keypoint queries
-        if "date" in cmd_name or cmd_name in ["keypoint_today", "keypoint_history"]:
-            date_match = re.search(r"(\d{4}-\d{2}-\d{2})", message)
-            if date_match:
-                params["date"] = date_match.group(1)
-            elif "history" in cmd_name or "昨天" in message or "yesterday" in message.lower():
-                params["date"] = (date.today() - timedelta(days=1)).isoformat()
-            elif "前天" in message:
-                params["date"] = (date.today() - timedelta(days=2)).isoformat()
-            else:
-                params["date"] = date.today().isoformat()
-
-        # Extract CEFR level
-        if "cefr" in cmd_name:
-            level_match = re.search(r"(A1|A2|B1|B2|C1|C2)", message, re.I)
-            if level_match:
-                params["cefr_level"] = level_match.group(1).upper()
-
-        # Extract style
-        if "style" in cmd_name:
-            style_map = {
-                "humorous": "humorous", "幽默": "humorous",
-                "rigorous": "rigorous", "严谨": "rigorous",
-                "casual": "casual", "随意": "casual", "轻松": "casual",
-                "professional": "professional", "专业": "professional"
-            }
-            for keyword, style in style_map.items():
-                if keyword in message.lower():
-                    params["tutor_style"] = style
-                    break
-
-        # Extract ratio
-        if "ratio" in cmd_name:
-            ratio_match = re.search(r"(\d{1,3})\s*(%|percent|百分比)?", message)
-            if ratio_match:
-                params["oral_written_ratio"] = int(ratio_match.group(1)) / 100.0
-
-        # Extract error notebook pagination params
-        if cmd_name and cmd_name.startswith("errors"):
-            # Page number
-            page_match = re.search(r"(第\s*)?(\d+)(\s*页|page)", message, re.I)
-            if page_match:
-                params["page"] = int(page_match.group(2))
-
-            # Month filter (YYYY-MM)
-            month_match = re.search(r"(\d{4}-\d{2})(?!-\d{2})", message)
-            if month_match:
-                params["month"] = month_match.group(1)
-
-            # Random count
-            random_match = re.search(r"(随机|random)\s*(\d*)", message, re.I)
-            if random_match:
-                count = int(random_match.group(2)) if random_match.group(2) else 5
-                params["random"] = count
-
-            # Default page for "more" command
-            if "more" in cmd_name:
-                params["page"] = params.get("page", 2)
-
-            # Review count (for errors_review command)
-            if "review" in cmd_name:
-                count_match = re.search(r"(复习|review|练习|practice)\s*(\d*)", message, re.I)
-                if count_match and count_match.group(2):
-                    params["count"] = int(count_match.group(2))
-                else:
-                    params["count"] = 5  # Default 5 questions per session
-
+        extractors = self._PARAM_EXTRACTORS.get(cmd_name)
+        if extractors:
+            message_lower = message.lower()
+            for extract in extractors:
+                extract(message, message_lower, params)
         return params
 
     def get_command_suggestions(self, context: str = "general") -> list:
@@ -298,6 +428,41 @@ class CommandParser:
         return suggestions.get(context, suggestions["general"])
 
 
+@lru_cache(maxsize=256)
+def _parse_command_cached(message: str) -> Tuple[Optional[str], Optional[Tuple[Tuple[str, Any], ...]]]:
+    """
+    Match a message against the command patterns (memoized per message).
+
+    Users repeat the same short commands ("quiz", "stats", "错题本"), so
+    the regex work is done once per distinct message.
+
+    Returns:
+        (command name or None, params as a tuple of items). Params are None
+        for date-dependent commands, which the caller extracts per call.
+    """
+    # Cheap literal scan first: most chatter mentions no command keyword.
+    # casefold() also covers characters that re.I treats as equal
+    # (e.g. "ſ" ~ "s"), so this never rejects a message a pattern matches.
+    if not _has_trigger(message.casefold()):
+        return None, None
+
+    match = CommandParser._COMBINED_COMMAND_RE.match(message)
+    if not match:
+        return None, None
+
+    cmd_name = match.lastgroup
+    if cmd_name in CommandParser._DATE_DEPENDENT_COMMANDS:
+        return cmd_name, None
+
+    params = {}
+    extractors = CommandParser._PARAM_EXTRACTORS[cmd_name]
+    if extractors:
+        message_lower = message.lower()
+        for extract in extractors:
+            extract(message, message_lower, params)
+    return cmd_name, tuple(params.items())
+
+
 # CLI interface for testing
 if __name__ == "__main__":
     import argparse
@@ -5,6 +5,8 @@ Shared constants for eng-lang-tutor.
 This module contains constants used across multiple scripts to avoid duplication.
 """
 
+from bisect import bisect_right
+
 # =============================================================================
 # GAME MECHANICS - Activity Levels & Progression
 # =============================================================================
@@ -27,6 +29,13 @@ LEVEL_NAMES = {
     (16, 20): "Pioneer"     # 开拓者
 }
 
+# Level -> stage name, flattened from LEVEL_NAMES for direct lookup
+_LEVEL_NAME_BY_LEVEL = {
+    level: name
+    for (min_level, max_level), name in LEVEL_NAMES.items()
+    for level in range(min_level, max_level + 1)
+}
+
 # Streak bonus configuration
 STREAK_BONUS_PER_DAY = 0.05  # 5% bonus per day
 STREAK_BONUS_CAP = 2.0       # Maximum 2x multiplier
@@ -90,10 +99,7 @@ def get_level_name(level: int) -> str:
     Returns:
         Stage name (Starter/Traveler/Explorer/Pioneer)
     """
-    for (min_level, max_level), name in LEVEL_NAMES.items():
-        if min_level <= level <= max_level:
-            return name
-    return "Unknown"
+    return _LEVEL_NAME_BY_LEVEL.get(level, "Unknown")
 
 
 def calculate_level(xp: int) -> int:
@@ -106,10 +112,24 @@ def calculate_level(xp: int) -> int:
     Returns:
         Level (1-20)
     """
-    for i in range(len(LEVEL_THRESHOLDS) - 1, -1, -1):
-        if xp >= LEVEL_THRESHOLDS[i]:
-            return i + 1
-    return 1
+    # Thresholds are ascending: the level is the number of thresholds reached
+    return max(1, bisect_right(LEVEL_THRESHOLDS, xp))
+
+
+def get_correct_rate(progress: dict) -> float:
+    """
+    Calculate the overall correct-answer rate from the progress counters.
+
+    Args:
+        progress: Progress dict with total_correct / total_answered
+
+    Returns:
+        Percentage (0.0 - 100.0, one decimal); 0.0 before any answers
+    """
+    total_answered = progress.get('total_answered', 0)
+    if not total_answered:
+        return 0.0
+    return round(100 * progress.get('total_correct', 0) / total_answered, 1)
 
 
 def get_streak_multiplier(streak: int) -> float:
@@ -12,9 +12,11 @@ Error Notebook Manager - 错题本管理
 从 state_manager.py 提取，遵循单一职责原则。
 """
 
-from typing import Dict, Any, List
+import random as random_module
+from typing import Dict, Any, List, Optional
 from datetime import datetime, date
 from collections import Counter
+from functools import lru_cache
 
 from .constants import (
     ERROR_ARCHIVE_WRONG_THRESHOLD,
@@ -23,6 +25,29 @@ from .constants import (
 )
 
 
+@lru_cache(maxsize=256)
+def _parse_error_date(value: str) -> Optional[date]:
+    """
+    Parse an error's YYYY-MM-DD date string.
+
+    Errors are stamped with date.isoformat(), so the C-level
+    date.fromisoformat() handles them; strptime is only the fallback for
+    hand-edited, non-padded dates. Errors from the same day share a string,
+    so results are cached.
+
+    Returns:
+        The parsed date, or None if the value is not a valid date
+    """
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        return None
+
+
 class ErrorNotebookManager:
     """错题本管理器"""
 
@@ -57,10 +82,11 @@ class ErrorNotebookManager:
 
         # Auto-archive oldest if over size limit
         if len(errors) > ERROR_NOTEBOOK_MAX:
-            # Sort by date to find oldest
-            errors.sort(key=lambda x: x.get('date', ''))
+            # Find the oldest (first one on ties) without reordering the
+            # notebook, so indices used by review_error stay valid
+            oldest_index = min(range(len(errors)), key=lambda i: errors[i].get('date', ''))
             # Archive the oldest
-            oldest = errors.pop(0)
+            oldest = errors.pop(oldest_index)
             archive = state.get('error_archive', [])
             oldest['archived_at'] = date.today().isoformat()
             oldest['archived_reason'] = 'notebook_full'
@@ -96,20 +122,15 @@ class ErrorNotebookManager:
                 'errors': [error_items]
             }
         """
-        import random as random_module
-
         errors = state.get('error_notebook', [])
 
-        # Sort by date descending (newest first)
-        errors = sorted(errors, key=lambda x: x.get('date', ''), reverse=True)
-
-        # Filter by month if specified
+        # Filter by month first so only the matching errors get sorted
         if month:
             errors = [e for e in errors if e.get('date', '').startswith(month)]
 
         total = len(errors)
 
-        # Random mode
+        # Random mode (order is irrelevant, no sort needed)
         if random and random > 0:
             random_count = min(random, total)
             selected = random_module.sample(errors, random_count) if total > 0 else []
@@ -123,6 +144,10 @@ class ErrorNotebookManager:
                 'errors': selected
             }
 
+        # Sort by date descending (newest first). The notebook is appended in
+        # date order, so this is a single linear pass for Timsort.
+        errors = sorted(errors, key=lambda x: x.get('date', ''), reverse=True)
+
         # Pagination
         total_pages = (total + per_page - 1) // per_page if per_page > 0 else 1
         page = max(1, min(page, total_pages)) if total_pages > 0 else 1
@@ -164,13 +189,12 @@ class ErrorNotebookManager:
         reviewed = sum(1 for e in errors if e.get('reviewed', False))
         unreviewed = len(errors) - reviewed
 
-        # Group by month
-        by_month = Counter()
-        for e in errors:
-            date_str = e.get('date', '')
-            if date_str:
-                month = date_str[:7]  # YYYY-MM
-                by_month[month] += 1
+        # Group by month (YYYY-MM); Counter tallies the generator in C
+        by_month = Counter(
+            date_str[:7]
+            for date_str in (e.get('date') for e in errors)
+            if date_str
+        )
 
         # Sort by month descending
         by_month_sorted = dict(sorted(by_month.items(), reverse=True))
@@ -264,14 +288,15 @@ class ErrorNotebookManager:
                 continue
 
             wrong_count = error.get('wrong_count', 1)
-            error_date_str = error.get('date', '')
 
-            # Calculate days since error was created
-            try:
-                error_date = datetime.strptime(error_date_str, '%Y-%m-%d').date()
-                days_old = (today - error_date).days
-            except (ValueError, TypeError):
-                days_old = 0
+            # Calculate days since error was created (only needed once the
+            # wrong_count threshold is met)
+            days_old = 0
+            if wrong_count >= ERROR_ARCHIVE_WRONG_THRESHOLD:
+                error_date_str = error.get('date', '')
+                error_date = _parse_error_date(error_date_str) if isinstance(error_date_str, str) else None
+                if error_date is not None:
+                    days_old = (today - error_date).days
 
             # Archive if wrong_count and days_old meet thresholds
             if wrong_count >= ERROR_ARCHIVE_WRONG_THRESHOLD and days_old >= ERROR_ARCHIVE_DAYS_THRESHOLD:
@@ -300,9 +325,7 @@ class ErrorNotebookManager:
         Returns:
             Updated state
         """
-        errors = state.get('error_notebook', [])
-        # Keep only unreviewed errors
-        state['error_notebook'] = [
-            e for e in errors if not e.get('reviewed', False)
-        ]
+        errors = state.setdefault('error_notebook', [])
+        # Keep only unreviewed errors (in place, the state entry stays the same list)
+        errors[:] = [e for e in errors if not e.get('reviewed', False)]
         return state
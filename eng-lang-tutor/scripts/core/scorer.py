@@ -10,9 +10,15 @@ XP Rules (Duolingo-style):
 """
 
 from typing import Dict, Any, List, Tuple, Optional
-from datetime import datetime
+from datetime import date
 
-from .constants import LEVEL_THRESHOLDS, calculate_level, get_streak_multiplier
+from .constants import (
+    LEVEL_THRESHOLDS,
+    QUIZ_QUESTIONS_PER_DAY,
+    calculate_level,
+    get_correct_rate,
+    get_streak_multiplier
+)
 
 
 class Scorer:
@@ -65,7 +71,7 @@ class Scorer:
             Tuple of (results, updated_state)
         """
         results = {
-            'date': datetime.now().strftime('%Y-%m-%d'),
+            'date': date.today().isoformat(),
             'quiz_date': quiz.get('quiz_date', ''),
             'total_questions': len(quiz.get('questions', [])),
             'correct_count': 0,
@@ -122,7 +128,7 @@ class Scorer:
         accuracy = (correct_count / total_questions * 100) if total_questions > 0 else 0
 
         # Calculate streak multiplier
-        streak = state.get('user', {}).get('streak', 0)
+        streak = (state.get('user') or {}).get('streak', 0)
         streak_multiplier = get_streak_multiplier(streak)
 
         # Calculate total XP with streak bonus
@@ -178,41 +184,46 @@ class Scorer:
             The same state dict (for convenience)
         """
         # Update XP
-        state['user']['xp'] = state.get('user', {}).get('xp', 0) + results['total_xp_earned']
+        user = state.setdefault('user', {})
+        user['xp'] = user.get('xp', 0) + results['total_xp_earned']
 
         # Update progress
-        progress = state.get('progress', {})
-        old_total = progress.get('total_quizzes', 0)
-        old_rate = progress.get('correct_rate', 0.0)
-
-        # Update correct rate (running average)
-        new_total = old_total + 1
-        new_rate = ((old_rate * old_total) + results['accuracy']) / new_total
-
-        progress['total_quizzes'] = new_total
-        progress['correct_rate'] = round(new_rate, 1)
+        progress = state.setdefault('progress', {})
+        total_quizzes = progress.get('total_quizzes', 0)
+        total_correct = progress.get('total_correct', 0)
+        total_answered = progress.get('total_answered', 0)
+
+        # State saved before the answer counters existed: seed them from the
+        # stored rate, assuming QUIZ_QUESTIONS_PER_DAY questions per quiz
+        if total_answered == 0 and total_quizzes > 0:
+            total_answered = total_quizzes * QUIZ_QUESTIONS_PER_DAY
+            total_correct = round(progress.get('correct_rate', 0.0) / 100 * total_answered)
+
+        progress['total_quizzes'] = total_quizzes + 1
+        progress['total_correct'] = total_correct + results['correct_count']
+        progress['total_answered'] = total_answered + results['total_questions']
+        # Derived from exact integer counts, so it does not drift over time
+        progress['correct_rate'] = get_correct_rate(progress)
         progress['last_study_date'] = results['date']
 
         # Track perfect quizzes
         if results['accuracy'] == 100:
             progress['perfect_quizzes'] = progress.get('perfect_quizzes', 0) + 1
 
-        state['progress'] = progress
-
         # Add errors to notebook
         if results['errors']:
-            error_notebook = state.get('error_notebook', [])
-            for error in results['errors']:
-                error_entry = {
-                    'date': results['date'],
+            error_date = results['date']
+            state.setdefault('error_notebook', []).extend([
+                {
+                    'date': error_date,
                     'question': error.get('question', ''),
                     'user_answer': error.get('user_answer', ''),
                     'correct_answer': error.get('correct_answer', ''),
                     'explanation': error.get('explanation', ''),
                     'reviewed': False
                 }
-                error_notebook.append(error_entry)
-            state['error_notebook'] = error_notebook
+                for error in results['errors']
+            ])
 
         return state
 
@@ -245,6 +256,21 @@ if __name__ == "__main__":
     import argparse
     import json
 
+    try:
+        import orjson
+    except ImportError:  # orjson is optional; fall back to the stdlib parser/encoder
+        orjson = None
+
+    def _loads(path: str) -> Any:
+        with open(path, 'rb') as f:
+            data = f.read()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+
+    def _dumps(obj: Any) -> str:
+        if orjson is not None:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+        return json.dumps(obj, indent=2)
+
     parser = argparse.ArgumentParser(description="Scorer for eng-lang-tutor")
     parser.add_argument('--quiz', type=str, help='Path to quiz JSON file')
     parser.add_argument('--answers', type=str, help='Path to user answers JSON file')
@@ -278,18 +304,15 @@ if __name__ == "__main__":
 
         results, updated = scorer.evaluate_quiz(quiz, answers, state)
         print("Results:")
-        print(json.dumps(results, indent=2))
+        print(_dumps(results))
         print("\nUpdated State (user section):")
-        print(json.dumps(updated['user'], indent=2))
-        print(json.dumps(updated['progress'], indent=2))
+        print(_dumps(updated['user']))
+        print(_dumps(updated['progress']))
 
     elif args.quiz and args.answers and args.state:
-        with open(args.quiz) as f:
-            quiz = json.load(f)
-        with open(args.answers) as f:
-            answers = json.load(f)
-        with open(args.state) as f:
-            state = json.load(f)
+        quiz = _loads(args.quiz)
+        answers = _loads(args.answers)
+        state = _loads(args.state)
 
         results, updated = scorer.evaluate_quiz(quiz, answers, state)
-        print(json.dumps(results, indent=2))
+        print(_dumps(results))
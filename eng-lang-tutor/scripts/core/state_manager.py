@@ -17,6 +17,11 @@ from typing import Dict, Any, Optional, List
 import shutil
 import threading
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
 try:
     from ..utils.helpers import deep_merge
     from .error_notebook import ErrorNotebookManager
@@ -25,6 +30,57 @@ except ImportError:
     from scripts.core.error_notebook import ErrorNotebookManager
 
 
+def _load_json(path: Path) -> Any:
+    """
+    Read and parse a JSON file (with orjson when installed).
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    catch parse errors the same way with either backend.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dump_json(obj: Any, path: Path) -> None:
+    """
+    Write an object as indented UTF-8 JSON (with orjson when installed).
+
+    The document is serialized before the file is opened, so a value that
+    cannot be encoded leaves the existing file untouched.
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def _copy_json(obj: Any) -> Any:
+    """Copy a parsed JSON tree (nested dicts/lists); much cheaper than copy.deepcopy."""
+    if isinstance(obj, dict):
+        return {key: _copy_json(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_copy_json(value) for value in obj]
+    return obj
+
+
+def _file_signature(path: Path) -> tuple:
+    """Identify a file version by inode, mtime and size (atomic renames change the inode)."""
+    st = path.stat()
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _json_line(obj: Any) -> bytes:
+    """Serialize an object as one compact UTF-8 JSON line (for .jsonl logs)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8') + b'\n'
+
+
 def get_default_state_dir() -> Path:
     """
     Get the default state directory path.
@@ -45,6 +101,9 @@ def get_default_state_dir() -> Path:
 class StateManager:
     """Manages state persistence and event logging."""
 
+    # Upper bound on cached daily files (a few content types x recent days)
+    JSON_CACHE_MAX = 64
+
     def __init__(self, data_dir: str = None):
         """
         Initialize the state manager.
@@ -76,6 +135,11 @@ class StateManager:
         # Track background audio generation threads
         self._audio_threads: Dict[str, Any] = {}
 
+        # Parsed file caches, revalidated by file signature on every read:
+        # (signature, merged state) and path -> (signature, content)
+        self._state_cache: Optional[tuple] = None
+        self._json_cache: Dict[Path, tuple] = {}
+
     def _migrate_from_old_location(self) -> None:
         """
         Migrate data from old data/ directory to new state directory.
@@ -189,6 +253,8 @@ class StateManager:
             "progress": {
                 "total_quizzes": 0,
                 "correct_rate": 0.0,
+                "total_correct": 0,
+                "total_answered": 0,
                 "last_study_date": None,
                 "perfect_quizzes": 0,
                 "expressions_learned": 0
@@ -209,10 +275,14 @@ class StateManager:
             return self._default_state()
 
         try:
-            with open(self.state_file, 'r', encoding='utf-8') as f:
-                state = json.load(f)
-            # Merge with defaults to ensure all fields exist
-            return self._merge_with_defaults(state)
+            # Re-parse only when the file changed since the last load; callers
+            # get their own copy, so in-place edits never leak into the cache
+            signature = _file_signature(self.state_file)
+            if self._state_cache is None or self._state_cache[0] != signature:
+                state = _load_json(self.state_file)
+                # Merge with defaults to ensure all fields exist
+                self._state_cache = (signature, self._merge_with_defaults(state))
+            return _copy_json(self._state_cache[1])
         except (json.JSONDecodeError, IOError) as e:
             print(f"Error loading state: {e}. Using defaults.")
             return self._default_state()
@@ -240,11 +310,11 @@ class StateManager:
         temp_file = self.state_file.with_suffix('.tmp')
 
         try:
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(state, f, ensure_ascii=False, indent=2)
+            _dump_json(state, temp_file)
 
             # Atomic rename
             temp_file.rename(self.state_file)
+            self._state_cache = None
         except IOError as e:
             print(f"Error saving state: {e}")
             if temp_file.exists():
@@ -271,8 +341,9 @@ class StateManager:
         }
 
         try:
-            with open(log_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(event, ensure_ascii=False) + '\n')
+            line = _json_line(event)
+            with open(log_file, 'ab') as f:
+                f.write(line)
         except IOError as e:
             print(f"Error appending event: {e}")
             raise
@@ -323,8 +394,7 @@ class StateManager:
 
         file_path = daily_path / f"{content_type}.json"
 
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(content, f, ensure_ascii=False, indent=2)
+        self._write_json(content, file_path)
 
         # Auto-generate audio for keypoints
         if content_type == 'keypoint' and generate_audio:
@@ -334,8 +404,7 @@ class StateManager:
                     'status': 'pending',
                     'generated_at': None
                 }
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(content, f, ensure_ascii=False, indent=2)
+                self._write_json(content, file_path)
 
                 # Start background thread
                 date_str = target_date.isoformat()
@@ -358,8 +427,7 @@ class StateManager:
                             'duration_seconds': audio_result.get('duration_seconds'),
                             'generated_at': datetime.now().isoformat()
                         }
-                        with open(file_path, 'w', encoding='utf-8') as f:
-                            json.dump(content, f, ensure_ascii=False, indent=2)
+                        self._write_json(content, file_path)
                 except Exception as e:
                     print(f"Warning: Audio generation failed: {e}")
 
@@ -378,16 +446,14 @@ class StateManager:
             audio_result = self.generate_keypoint_audio(target_date)
             if audio_result.get('success'):
                 # Re-read and update
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = json.load(f)
+                content = _load_json(file_path)
                 content['audio'] = {
                     'status': 'completed',
                     'composed': audio_result.get('audio_path'),
                     'duration_seconds': audio_result.get('duration_seconds'),
                     'generated_at': datetime.now().isoformat()
                 }
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(content, f, ensure_ascii=False, indent=2)
+                self._write_json(content, file_path)
         except Exception as e:
             print(f"Warning: Background audio generation failed for {date_str}: {e}")
         finally:
@@ -466,7 +532,8 @@ class StateManager:
             # - Other platforms: may need fallback
             convert_result = convert_mp3_to_opus(
                 input_path=mp3_path,
-                output_path=opus_path
+                output_path=opus_path,
+                known_duration=result.duration_seconds
             )
 
             if convert_result.success:
@@ -491,8 +558,7 @@ class StateManager:
             # Save updated keypoint
             daily_path = self.get_daily_dir(target_date)
             file_path = daily_path / "keypoint.json"
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(keypoint, f, ensure_ascii=False, indent=2)
+            self._write_json(keypoint, file_path)
 
             return {
                 'success': True,
@@ -526,12 +592,45 @@ class StateManager:
             return None
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return self._load_json_cached(file_path)
         except (json.JSONDecodeError, IOError) as e:
             print(f"Error loading {content_type}: {e}")
             return None
 
+    def _write_json(self, obj: Any, file_path: Path) -> None:
+        """
+        Write a daily JSON file and drop its cached parsed content.
+
+        The (mtime, size) signature cannot detect a same-size rewrite within
+        the filesystem's timestamp granularity, so writers invalidate explicitly.
+
+        Args:
+            obj: JSON-serializable content
+            file_path: Path to the JSON file
+        """
+        _dump_json(obj, file_path)
+        self._json_cache.pop(file_path, None)
+
+    def _load_json_cached(self, file_path: Path) -> Any:
+        """
+        Load a JSON file, reusing the parsed content while the file is unchanged.
+
+        Args:
+            file_path: Path to the JSON file
+
+        Returns:
+            A private copy of the parsed content
+        """
+        signature = _file_signature(file_path)
+        cached = self._json_cache.get(file_path)
+        if cached is None or cached[0] != signature:
+            cached = (signature, _load_json(file_path))
+            if len(self._json_cache) >= self.JSON_CACHE_MAX:
+                # Evict the oldest entry (dicts keep insertion order)
+                self._json_cache.pop(next(iter(self._json_cache)), None)
+            self._json_cache[file_path] = cached
+        return _copy_json(cached[1])
+
     def get_recent_daily_content(self, days: int = 14) -> List[Dict[str, Any]]:
         """
         Get content from recent N days for deduplication.
@@ -783,8 +882,7 @@ class StateManager:
         backup_file = backup_path / f"state_backup_{timestamp}.json"
 
         state = self.load_state()
-        with open(backup_file, 'w', encoding='utf-8') as f:
-            json.dump(state, f, ensure_ascii=False, indent=2)
+        _dump_json(state, backup_file)
 
         return backup_file
 
@@ -799,8 +897,7 @@ class StateManager:
             True if successful, False otherwise
         """
         try:
-            with open(backup_file, 'r', encoding='utf-8') as f:
-                state = json.load(f)
+            state = _load_json(backup_file)
             self.save_state(state)
             return True
         except (json.JSONDecodeError, IOError) as e:
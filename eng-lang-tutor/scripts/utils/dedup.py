@@ -12,6 +12,9 @@ from typing import Dict, Any, List, Set, Optional, Tuple
 from datetime import datetime, timedelta
 import re
 
+# Punctuation stripped when normalizing expressions for comparison
+PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
 
 class DeduplicationManager:
     """Manages content deduplication to avoid repetitive learning."""
@@ -100,14 +103,14 @@ class DeduplicationManager:
         for expr in content.get('expressions', []):
             phrase = expr.get('phrase', '').lower().strip()
             # Normalize: remove punctuation, collapse whitespace
-            normalized = re.sub(r'[^\w\s]', '', phrase)
+            normalized = PUNCTUATION_RE.sub('', phrase)
             normalized = ' '.join(normalized.split())
             if normalized:
                 expressions.add(normalized)
 
         # Alternatives
         for alt in content.get('alternatives', []):
-            normalized = re.sub(r'[^\w\s]', '', alt.lower())
+            normalized = PUNCTUATION_RE.sub('', alt.lower())
             normalized = ' '.join(normalized.split())
             if normalized:
                 expressions.add(normalized)
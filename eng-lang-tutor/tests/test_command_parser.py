@@ -0,0 +1,63 @@
+"""Tests for command parsing and the per-message parse cache."""
+
+from datetime import date
+
+import pytest
+
+from scripts.cli import command_parser
+from scripts.cli.command_parser import CommandParser, _parse_command_cached
+
+STATE = {"initialized": True}
+
+
+class FakeDate(date):
+    """date whose today() is controlled by the test."""
+
+    current = date(2024, 3, 10)
+
+    @classmethod
+    def today(cls):
+        return cls.current
+
+
+@pytest.fixture
+def fake_today(monkeypatch):
+    _parse_command_cached.cache_clear()
+    monkeypatch.setattr(command_parser, "date", FakeDate)
+    monkeypatch.setattr(FakeDate, "current", date(2024, 3, 10))
+    yield FakeDate
+    _parse_command_cached.cache_clear()
+
+
+def test_today_is_not_served_stale_from_cache(fake_today):
+    parser = CommandParser()
+
+    first = parser.parse("keypoint today", STATE)
+    fake_today.current = date(2024, 3, 11)
+    second = parser.parse("keypoint today", STATE)
+
+    assert first["params"] == {"date": "2024-03-10"}
+    assert second["params"] == {"date": "2024-03-11"}
+
+
+def test_yesterday_is_not_served_stale_from_cache(fake_today):
+    parser = CommandParser()
+
+    first = parser.parse("知识点 昨天", STATE)
+    fake_today.current = date(2024, 3, 11)
+    second = parser.parse("知识点 昨天", STATE)
+
+    assert first["params"] == {"date": "2024-03-09"}
+    assert second["params"] == {"date": "2024-03-10"}
+
+
+def test_cached_params_are_not_shared_between_calls():
+    _parse_command_cached.cache_clear()
+    parser = CommandParser()
+
+    first = parser.parse("errors random 5", STATE)
+    first["params"]["random"] = 99
+    second = parser.parse("errors random 5", STATE)
+
+    assert second["command"] == "errors_random"
+    assert second["params"] == {"random": 5}
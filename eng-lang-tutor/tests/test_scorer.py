@@ -0,0 +1,55 @@
+"""Tests for quiz scoring and progress counters."""
+
+from scripts.core.scorer import Scorer
+
+
+QUIZ = {
+    "questions": [
+        {"id": 1, "type": "multiple_choice", "correct_answer": "A"},
+        {"id": 2, "type": "multiple_choice", "correct_answer": "B"},
+        {"id": 3, "type": "multiple_choice", "correct_answer": "C"},
+    ]
+}
+
+
+def test_legacy_state_is_seeded_from_correct_rate():
+    # Saved before total_correct / total_answered existed
+    state = {
+        "user": {"xp": 100, "streak": 0},
+        "progress": {"total_quizzes": 10, "correct_rate": 75.0},
+    }
+
+    _, state = Scorer().evaluate_quiz(QUIZ, {"1": "A", "2": "B", "3": "x"}, state)
+
+    progress = state["progress"]
+    # 10 quizzes * 3 questions at 75% -> 22 of 30, plus 2 of 3 from this quiz
+    assert progress["total_quizzes"] == 11
+    assert progress["total_answered"] == 33
+    assert progress["total_correct"] == 24
+    assert progress["correct_rate"] == 72.7
+
+
+def test_counters_accumulate_after_seeding():
+    state = {"progress": {"total_quizzes": 10, "correct_rate": 75.0}}
+    scorer = Scorer()
+
+    _, state = scorer.evaluate_quiz(QUIZ, {"1": "A", "2": "B", "3": "x"}, state)
+    _, state = scorer.evaluate_quiz(QUIZ, {"1": "A", "2": "B", "3": "C"}, state)
+
+    progress = state["progress"]
+    # Seeding happens only once; the second quiz adds to the exact counts
+    assert progress["total_answered"] == 36
+    assert progress["total_correct"] == 27
+    assert progress["correct_rate"] == 75.0
+    assert state["user"]["xp"] > 0
+
+
+def test_fresh_state_starts_from_zero():
+    state = {"progress": {"total_quizzes": 0, "correct_rate": 0.0}}
+
+    _, state = Scorer().evaluate_quiz(QUIZ, {"1": "A"}, state)
+
+    progress = state["progress"]
+    assert progress["total_answered"] == 3
+    assert progress["total_correct"] == 1
+    assert progress["correct_rate"] == 33.3
@@ -0,0 +1,53 @@
+"""Tests for StateManager's cached state and daily content loading."""
+
+import os
+from datetime import date
+
+from scripts.core.state_manager import StateManager
+
+DAY = date(2024, 3, 10)
+
+
+def test_daily_content_refreshes_after_save(tmp_path):
+    manager = StateManager(str(tmp_path))
+
+    path = manager.save_daily_content("quiz", {"answer": "a"}, DAY, generate_audio=False)
+    assert manager.load_daily_content("quiz", DAY) == {"answer": "a"}
+
+    # Same-size rewrite with the old timestamp, as on a coarse-mtime filesystem
+    stat = path.stat()
+    manager.save_daily_content("quiz", {"answer": "b"}, DAY, generate_audio=False)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert path.stat().st_size == stat.st_size
+
+    assert manager.load_daily_content("quiz", DAY) == {"answer": "b"}
+
+
+def test_daily_content_refreshes_after_external_write(tmp_path):
+    manager = StateManager(str(tmp_path))
+
+    path = manager.save_daily_content("quiz", {"answer": "a"}, DAY, generate_audio=False)
+    assert manager.load_daily_content("quiz", DAY) == {"answer": "a"}
+
+    path.write_text('{"answer": "changed"}', encoding="utf-8")
+
+    assert manager.load_daily_content("quiz", DAY) == {"answer": "changed"}
+
+
+def test_loaded_content_is_a_private_copy(tmp_path):
+    manager = StateManager(str(tmp_path))
+    manager.save_daily_content("quiz", {"questions": [1]}, DAY, generate_audio=False)
+
+    manager.load_daily_content("quiz", DAY)["questions"].append(2)
+
+    assert manager.load_daily_content("quiz", DAY) == {"questions": [1]}
+
+
+def test_state_refreshes_after_save(tmp_path):
+    manager = StateManager(str(tmp_path))
+
+    state = manager.load_state()
+    state["user"]["xp"] = 42
+    manager.save_state(state)
+
+    assert manager.load_state()["user"]["xp"] == 42